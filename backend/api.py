@@ -2532,6 +2532,29 @@ Please check the BESS Manager logs for details.
         )
 
 
+@router.get("/api/performance")
+async def get_performance() -> dict:
+    """Get per-phase optimizer timings over today's solves.
+
+    Returns p50/p95/max of each solve phase (backward induction, forward
+    selection, tie detection, PWL resolution, replay accounting, tie policy)
+    and of the total, plus the latest solve's breakdown. A solve slower than
+    `overrunSeconds` makes the next quarterly run misfire.
+    """
+    from app import bess_controller
+
+    _require_configured_system(bess_controller)
+
+    try:
+        performance: dict = convert_keys_to_camel_case(
+            bess_controller.system.get_solve_performance()
+        )
+        return performance
+    except Exception as e:
+        logger.error(f"Error getting solver performance: {e}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @router.get("/api/runtime-failures")
 async def get_runtime_failures():
     """Get all active runtime failures.
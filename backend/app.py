@@ -491,6 +491,9 @@ class BESSController:
         completes the setup wizard.
         """
         self.startup_status = "Connecting to Home Assistant..."
+        # Live sensor reads come from a state_changed subscription once it is
+        # up; until then (and whenever it drops) they go over REST.
+        self.ha_controller.start_state_cache()
         self.system.start(status_callback=self._update_startup_status)
 
         if not self.system.is_configured:
@@ -856,6 +856,34 @@ class TestExportDebugData:
         assert resp.status_code == 200
 
 
+# ===========================================================================
+# GET /api/performance
+# ===========================================================================
+
+
+class TestPerformance:
+    def test_returns_camel_cased_phase_summary(self):
+        ctrl = _make_started_controller()
+        ctrl.system.get_solve_performance.return_value = {
+            "solves": 1,
+            "phases": {"backward_induction": {"p50": 1.0, "p95": 1.0, "max": 1.0}},
+            "overrun_seconds": 30.0,
+        }
+        sys.modules["app"].bess_controller = ctrl
+
+        resp = _client.get("/api/performance")
+
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["phases"]["backwardInduction"]["p95"] == 1.0
+        assert body["overrunSeconds"] == 30.0
+
+    def test_unconfigured_returns_503(self):
+        sys.modules["app"].bess_controller = _unconfigured_controller()
+        resp = _client.get("/api/performance")
+        assert resp.status_code == 503
+
+
 # ===========================================================================
 # GET /api/runtime-failures
 # POST /api/runtime-failures/{failure_id}/dismiss
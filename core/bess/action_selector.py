@@ -24,6 +24,7 @@ action space itself has one definition even where the evaluation loop does
 not.
 """
 
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 
@@ -50,6 +51,7 @@ from core.bess.execution_model import (
 )
 from core.bess.models import GRID_FLOW_RESOLUTION_KWH
 from core.bess.settings import BatterySettings
+from core.bess.solve_timings import PHASE_TIE_POLICY, record_phase
 from core.bess.strategic_intent import FLOW_NOISE_FLOOR_KWH
 from core.bess.tie_detection import epsilon_for_period
 from core.bess.tie_policy import TieContext, apply_tie_policy
@@ -755,6 +757,7 @@ def select_action(
     # measured at, and every table row is measured against that winner.
     value_slope = eval_value_slope(candidates[argmax_index].next_soe)
     epsilon = epsilon_for_period(value_slope, SOE_STEP_KWH)
+    tie_policy_started = time.perf_counter()
     chosen_index = apply_tie_policy(
         candidates,
         argmax_index,
@@ -769,6 +772,7 @@ def select_action(
             ),
         ),
     )
+    record_phase(PHASE_TIE_POLICY, tie_policy_started)
 
     return SelectionResult(
         chosen=candidates[chosen_index],
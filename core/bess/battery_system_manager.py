@@ -7,6 +7,7 @@ import json
 import logging
 import os
 import traceback
+from dataclasses import asdict
 from datetime import UTC, date, datetime, timedelta
 from typing import Any, ClassVar
 
@@ -15,12 +16,14 @@ import requests
 from . import time_utils
 from .daily_view_builder import DailyView, DailyViewBuilder
 from .daily_view_store import DailyViewStore
+from .data_gathering import DataGatheringStage, DataSource, GatheredData
 from .dp_battery_algorithm import (
     OptimizationResult,
     optimize_battery_schedule,
     print_optimization_results,
 )
 from .dp_schedule import DPSchedule
+from .dp_value_cache import DPValueCache
 from .entsoe_source import EntsoeSource
 from .exceptions import (
     HAStatisticsUnavailableError,
@@ -63,6 +66,7 @@ from .settings import (
 from .solax_controller import SolaxController
 from .solax_modbus_growatt_controller import SolaxModbusGrowattController
 from .solis_modbus_controller import SolisModbusController
+from .solve_timings import summarize_solve_timings
 from .terminal_value import terminal_value_breakdown
 from .time_utils import (
     format_period,
@@ -73,6 +77,32 @@ from .weather import fetch_temperature_forecast
 
 logger = logging.getLogger(__name__)
 
+# The quarterly job's `misfire_grace_time` in backend/app.py. A solve that
+# takes longer makes the next quarterly run misfire and be dropped.
+SOLVE_OVERRUN_SECONDS = 30.0
+
+# Share of that grace the #450 PWL window re-solves may use, counted from
+# the start of the solve (`pwl_budget`). The remaining 10 s covers the
+# accounting after the windows, the window already in flight when the
+# budget runs out, and this manager's own work around the solve.
+PWL_BUDGET_SECONDS = 20.0
+
+# Per-source deadlines of the concurrent fetches in front of each solve
+# (`_gather_inputs`), counted from the start of that stage. A source that
+# misses its deadline is served from its last value, so one slow endpoint
+# costs at most its deadline instead of the whole grace. The energy-data
+# update has no deadline: the solve reads the historical store it writes.
+GATHER_DEADLINES_SECONDS = {
+    "prices": 8.0,
+    "consumption": 8.0,
+    "solar": 5.0,
+    "temperature": 5.0,
+}
+
+# Quarter-hour periods of temperature forecast fetched per run: the longest
+# optimization horizon (today + tomorrow), sliced to the actual one.
+TEMPERATURE_FORECAST_PERIODS = 192
+
 
 class BatterySystemManager:
     """
@@ -181,6 +211,16 @@ class BatterySystemManager:
         self._consumption_predictions: list[float] | None = None
         self._consumption_predictions_date: date | None = None
 
+        # Warm-start cache for the DP's value function: consecutive quarterly
+        # solves share the horizon's tail, so only rows in front of the last
+        # changed period are recomputed (see dp_value_cache.py).
+        self._dp_value_cache = DPValueCache()
+
+        # Concurrent input fetching in front of each solve, and the timings
+        # of its latest run for /api/performance (see data_gathering.py).
+        self._data_gathering = DataGatheringStage()
+        self._last_gathering: GatheredData | None = None
+
         # Critical sensor failure tracking for graceful degradation
         self._critical_sensor_failures = []
 
@@ -648,14 +688,20 @@ class BatterySystemManager:
             # Handle special cases (midnight, next day prep)
             self._handle_special_cases(current_period, prepare_next_day, is_first_run)
 
+            # Fetch prices, forecasts and the completed period's energy data
+            # concurrently (see data_gathering.py)
+            gathered = self._gather_inputs(
+                current_period, is_first_run, prepare_next_day
+            )
+
             # Get price data
-            prices, price_entries = self._get_price_data(prepare_next_day)
+            prices, price_entries = gathered.get("prices")
             if not prices:
                 logger.warning("Schedule update aborted: No price data available")
                 return False
 
-            # Update energy data for completed period
-            self._update_energy_data(current_period, is_first_run, prepare_next_day)
+            # Surface a failed energy-data update, as the direct call did
+            gathered.get("energy_data")
 
             # Get current battery state
             current_soc = self._get_current_battery_soc()
@@ -665,7 +711,13 @@ class BatterySystemManager:
 
             # Gather optimization data
             optimization_data_result = self._gather_optimization_data(
-                current_period, current_soc, prepare_next_day, len(prices)
+                current_period,
+                current_soc,
+                prepare_next_day,
+                len(prices),
+                consumption_predictions=gathered.get("consumption"),
+                solar_predictions=gathered.get("solar"),
+                tomorrow_solar=gathered.values.get("solar_tomorrow"),
             )
 
             if optimization_data_result is None:
@@ -681,6 +733,7 @@ class BatterySystemManager:
                 prices,
                 price_entries,
                 prepare_next_day,
+                temperatures=gathered.get("temperature"),
             )
 
             if optimization_result is None:
@@ -1766,8 +1819,110 @@ class BatterySystemManager:
             )
             return forecast
 
+    def _get_consumption_predictions(self) -> list[float]:
+        """Consumption forecast for this quarterly run (issue #395).
+
+        'sensor'/'fixed' read a cheap, continuously-updating source, so
+        they refetch every quarterly cycle (same as solar).
+        'influxdb_7d_avg'/'ha_statistics' average a window of full
+        calendar days ending at today's midnight — that value can't
+        change intraday, so it's only refetched once the date rolls over,
+        instead of only at startup/23:55.
+        """
+        if (
+            self.home_settings.consumption_strategy
+            not in self._DATE_CACHED_CONSUMPTION_STRATEGIES
+        ):
+            return self._get_consumption_forecast()
+
+        if (
+            self._consumption_predictions is not None
+            and self._consumption_predictions_date == time_utils.today()
+        ):
+            return self._consumption_predictions
+
+        consumption_predictions = self._get_consumption_forecast()
+        self._consumption_predictions = consumption_predictions
+        self._consumption_predictions_date = time_utils.today()
+        return consumption_predictions
+
+    def _get_solar_predictions(self, prepare_next_day: bool) -> list[float]:
+        """Solar forecast for the day being scheduled."""
+        if prepare_next_day:
+            # The next-day schedule must be built from tomorrow's solar forecast, not today's.
+            return self._fetch_tomorrow_solar_forecast()
+        return self.controller.get_solar_forecast()
+
+    def _gather_inputs(
+        self, period: int, is_first_run: bool, prepare_next_day: bool
+    ) -> GatheredData:
+        """Run the quarterly run's independent fetches concurrently.
+
+        Each source gets a deadline from GATHER_DEADLINES_SECONDS and falls
+        back to its last value fetched for the same day (and, for prices and
+        solar, the same today/next-day run); see data_gathering.py.
+        """
+        today = time_utils.today()
+        sources = [
+            DataSource(
+                "prices",
+                lambda: self._get_price_data(prepare_next_day),
+                GATHER_DEADLINES_SECONDS["prices"],
+                cache_key=(today, prepare_next_day),
+            ),
+            DataSource(
+                "energy_data",
+                lambda: self._update_energy_data(
+                    period, is_first_run, prepare_next_day
+                ),
+                deadline=None,
+                fallback=False,
+            ),
+            DataSource(
+                "consumption",
+                self._get_consumption_predictions,
+                GATHER_DEADLINES_SECONDS["consumption"],
+                cache_key=today,
+            ),
+            DataSource(
+                "solar",
+                lambda: self._get_solar_predictions(prepare_next_day),
+                GATHER_DEADLINES_SECONDS["solar"],
+                cache_key=(today, prepare_next_day),
+            ),
+            DataSource(
+                "temperature",
+                self._fetch_temperature_forecast,
+                GATHER_DEADLINES_SECONDS["temperature"],
+                cache_key=today,
+            ),
+        ]
+        if not prepare_next_day:
+            # Only used once tomorrow's prices extend the horizon, but
+            # fetched alongside the rest so that case costs no extra wait.
+            sources.append(
+                DataSource(
+                    "solar_tomorrow",
+                    self._fetch_tomorrow_solar_forecast,
+                    GATHER_DEADLINES_SECONDS["solar"],
+                    cache_key=today,
+                )
+            )
+
+        gathered = self._data_gathering.gather(sources)
+        self._last_gathering = gathered
+        logger.info("Data gathering: %s", gathered.describe())
+        return gathered
+
     def _gather_optimization_data(
-        self, period: int, current_soc: float, prepare_next_day: bool, period_count: int
+        self,
+        period: int,
+        current_soc: float,
+        prepare_next_day: bool,
+        period_count: int,
+        consumption_predictions: list[float] | None = None,
+        solar_predictions: list[float] | None = None,
+        tomorrow_solar: list[float] | None = None,
     ) -> tuple[int, dict[str, list[float]]] | None:
         """Always return full period data combining actuals + predictions with correct SOC progression.
 
@@ -1776,6 +1931,12 @@ class BatterySystemManager:
             current_soc: Current state of charge (%)
             prepare_next_day: Whether preparing for next day
             period_count: Number of periods in the day (handles DST: 92, 96, or 100)
+            consumption_predictions: Already-fetched consumption forecast, or
+                None to fetch it here
+            solar_predictions: Already-fetched solar forecast for the day
+                being scheduled, or None to fetch it here
+            tomorrow_solar: Already-fetched tomorrow's solar forecast for an
+                extended horizon, or None to fetch it here if needed
         """
 
         if period < 0:
@@ -1784,35 +1945,12 @@ class BatterySystemManager:
 
         current_soe = current_soc / 100.0 * self.battery_settings.total_capacity
 
-        # --- Fetch predictions (issue #395) ---
-        # 'sensor'/'fixed' read a cheap, continuously-updating source, so
-        # they refetch every quarterly cycle (same as solar, below).
-        # 'influxdb_7d_avg'/'ha_statistics' average a window of full
-        # calendar days ending at today's midnight — that value can't
-        # change intraday, so it's only refetched once the date rolls over,
-        # instead of only at startup/23:55.
-        if (
-            self.home_settings.consumption_strategy
-            in self._DATE_CACHED_CONSUMPTION_STRATEGIES
-        ):
-            consumption_predictions_fresh = (
-                self._consumption_predictions is not None
-                and self._consumption_predictions_date == time_utils.today()
-            )
-            if consumption_predictions_fresh:
-                consumption_predictions = self._consumption_predictions
-            else:
-                consumption_predictions = self._get_consumption_forecast()
-                self._consumption_predictions = consumption_predictions
-                self._consumption_predictions_date = time_utils.today()
-        else:
-            consumption_predictions = self._get_consumption_forecast()
-
-        if prepare_next_day:
-            # The next-day schedule must be built from tomorrow's solar forecast, not today's.
-            solar_predictions = self._fetch_tomorrow_solar_forecast()
-        else:
-            solar_predictions = self.controller.get_solar_forecast()
+        # update_battery_schedule passes these in from the concurrent data
+        # gathering stage; direct callers get them fetched here.
+        if consumption_predictions is None:
+            consumption_predictions = self._get_consumption_predictions()
+        if solar_predictions is None:
+            solar_predictions = self._get_solar_predictions(prepare_next_day)
 
         # --- Extend arrays to match period_count when horizon spans tomorrow ---
         if period_count > len(consumption_predictions):
@@ -1836,7 +1974,8 @@ class BatterySystemManager:
                 )
             else:
                 # Extended horizon: fetch tomorrow's actual solar forecast for better optimization.
-                tomorrow_solar = self._fetch_tomorrow_solar_forecast()
+                if tomorrow_solar is None:
+                    tomorrow_solar = self._fetch_tomorrow_solar_forecast()
                 logger.info(
                     "Extended solar predictions with tomorrow's forecast (%d periods)",
                     len(tomorrow_solar),
@@ -1988,20 +2127,13 @@ class BatterySystemManager:
         )
         return float(breakdown["terminal_value"])
 
-    def _get_temperature_derated_charge_limits(
-        self, num_periods: int
-    ) -> list[float] | None:
-        """Get per-period max charge power limits based on temperature forecast.
-
-        When temperature derating is enabled, fetches the weather forecast and
-        applies the configured derating curve to produce per-period charge limits.
-
-        Args:
-            num_periods: Number of 15-minute periods to produce limits for.
+    def _fetch_temperature_forecast(self) -> list[float] | None:
+        """Fetch the quarterly temperature forecast for the longest horizon.
 
         Returns:
-            List of max charge power values (kW) per period, or None if derating
-            is disabled.
+            Temperatures (°C) for TEMPERATURE_FORECAST_PERIODS periods from
+            the current hour, or None if derating is disabled or has no
+            weather entity.
 
         Raises:
             RuntimeError: If the weather forecast cannot be fetched (propagated
@@ -2021,14 +2153,44 @@ class BatterySystemManager:
         # Get timezone from time_utils (set at startup from HA config)
         timezone_str = str(time_utils.TIMEZONE)
 
-        temperatures = fetch_temperature_forecast(
+        return fetch_temperature_forecast(
             ha_url=self.controller.base_url,
             ha_token=self.controller.token,
             weather_entity=weather_entity,
             timezone=timezone_str,
-            num_periods=num_periods,
+            num_periods=TEMPERATURE_FORECAST_PERIODS,
         )
 
+    def _get_temperature_derated_charge_limits(
+        self, num_periods: int, temperatures: list[float] | None = None
+    ) -> list[float] | None:
+        """Get per-period max charge power limits based on temperature forecast.
+
+        When temperature derating is enabled, applies the configured derating
+        curve to the weather forecast to produce per-period charge limits.
+
+        Args:
+            num_periods: Number of 15-minute periods to produce limits for.
+            temperatures: Forecast from _fetch_temperature_forecast, or None
+                to fetch it here.
+
+        Returns:
+            List of max charge power values (kW) per period, or None if derating
+            is disabled.
+
+        Raises:
+            RuntimeError: If the weather forecast cannot be fetched (propagated
+                from fetch_temperature_forecast).
+        """
+        if temperatures is None:
+            temperatures = self._fetch_temperature_forecast()
+        if temperatures is None:
+            return None
+
+        # The forecast is padded with its last value, so the first
+        # num_periods are what a forecast of exactly num_periods would be.
+        temperatures = temperatures[:num_periods]
+
         derated_limits = apply_temperature_derating(
             max_charge_power_kw=self.battery_settings.max_charge_power_kw,
             temperatures=temperatures,
@@ -2055,8 +2217,13 @@ class BatterySystemManager:
         prices: list[float],
         price_entries: list[dict[str, Any]],
         prepare_next_day: bool,
+        temperatures: list[float] | None = None,
     ) -> OptimizationResult | None:
-        """Run optimization - now returns OptimizationResult directly."""
+        """Run optimization - now returns OptimizationResult directly.
+
+        `temperatures` is the forecast update_battery_schedule already
+        gathered; None fetches it here when derating is enabled.
+        """
 
         try:
             current_soe = optimization_data["combined_soe"][optimization_period]
@@ -2125,7 +2292,7 @@ class BatterySystemManager:
             # Get temperature-based charge power limits if derating is enabled.
             # The returned list is already sized for n_periods (the remaining horizon).
             max_charge_power_per_period = self._get_temperature_derated_charge_limits(
-                n_periods
+                n_periods, temperatures
             )
 
             # Run DP optimization with strategic intent capture - returns OptimizationResult directly
@@ -2144,7 +2311,22 @@ class BatterySystemManager:
                 capabilities=self.platform_capabilities,
                 export_curtailment_active=self.export_curtailment_active,
                 home_settings=self.home_settings,
+                value_cache=self._dp_value_cache,
+                pwl_budget_seconds=PWL_BUDGET_SECONDS,
             )
+            if result.timings is not None:
+                if result.timings.total > SOLVE_OVERRUN_SECONDS:
+                    logger.warning(
+                        "Optimization took %s -- longer than the quarterly "
+                        "job's %.0fs misfire grace; %s dominated",
+                        result.timings.describe(),
+                        SOLVE_OVERRUN_SECONDS,
+                        result.timings.dominant_phase(),
+                    )
+                else:
+                    logger.info(
+                        "Optimization phase timings: %s", result.timings.describe()
+                    )
 
             # Add timestamps to period data (algorithm is time-agnostic, operates on relative indices)
             self._add_timestamps_to_period_data(
@@ -3300,6 +3482,31 @@ class BatterySystemManager:
         """Get cached health check results from startup (avoids re-running expensive checks)."""
         return getattr(self, "_cached_health_results", None)
 
+    def get_solve_performance(self) -> dict:
+        """Per-phase optimizer timings over today's solves: p50/p95/max of
+        each phase and of the total, plus the latest solve's breakdown and
+        the per-source wall times of the latest data gathering."""
+        solves = [
+            stored.optimization_result.timings
+            for stored in self.schedule_store.get_all_schedules_today()
+            if stored.optimization_result.timings is not None
+        ]
+        summary = summarize_solve_timings(solves)
+        summary["latest"] = asdict(solves[-1]) if solves else None
+        summary["overrun_seconds"] = SOLVE_OVERRUN_SECONDS
+        gathering = self._last_gathering
+        summary["data_gathering"] = (
+            {
+                "total": gathering.total,
+                "sources": {
+                    name: asdict(timing) for name, timing in gathering.timings.items()
+                },
+            }
+            if gathering is not None
+            else None
+        )
+        return summary
+
     def get_runtime_failures(self) -> list:
         """Get all active (non-dismissed) runtime API failures.
 
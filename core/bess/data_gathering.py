@@ -0,0 +1,180 @@
+"""Concurrent input fetching in front of each quarterly optimization.
+
+Every quarterly run needs prices, the consumption and solar forecasts, the
+temperature forecast and the previous period's actuals before it can solve.
+Each comes from a different endpoint (HA, InfluxDB, a price API), none
+depends on another, and fetched one after another their latencies add up:
+one slow endpoint pushed the whole job toward the scheduler's 30 s
+`misfire_grace_time`. This stage runs them side by side and bounds how long
+it waits for each.
+
+Design:
+- A small, long-lived ThreadPoolExecutor shared by every run; a source
+  whose previous fetch is still running is not submitted again, so a hung
+  endpoint occupies at most one worker no matter how many runs it spans.
+- Each source has a deadline counted from the start of the stage, or None
+  to wait for it: the energy-data update writes the historical store the
+  solve reads next, so it is never abandoned half-way, and has no earlier
+  value to stand in for it either.
+- A source that misses its deadline, or raises, is served from its last
+  successful value when that value was fetched under the same cache key
+  (e.g. the same day); otherwise its error is kept and re-raised when the
+  caller asks for it, exactly where the sequential fetch would have raised.
+- The abandoned fetch keeps running and its result, when it arrives,
+  becomes the value the next run falls back to.
+- Every source's wall time and outcome is recorded for the log line and
+  `/api/performance`.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any
+
+from .exceptions import DataSourceTimeoutError
+
+logger = logging.getLogger(__name__)
+
+FETCHED = "fetched"
+CACHED = "cached"
+FAILED = "failed"
+
+
+@dataclass
+class DataSource:
+    """One independent fetch of the stage.
+
+    `deadline` is in seconds from the start of the stage, or None to wait
+    for the fetch however long it takes. A fallback value is only reused
+    under an equal `cache_key`, and never when `fallback` is off.
+    """
+
+    name: str
+    fetch: Callable[[], Any]
+    deadline: float | None
+    cache_key: Hashable = None
+    fallback: bool = True
+
+
+@dataclass
+class SourceTiming:
+    """Wall-clock seconds one source took (or was waited for) and whether
+    its value was `fetched`, served from the `cached` last value, or
+    `failed` with nothing to fall back to."""
+
+    seconds: float
+    outcome: str
+
+
+@dataclass
+class GatheredData:
+    """The values of one stage run, by source name."""
+
+    values: dict[str, Any] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+    timings: dict[str, SourceTiming] = field(default_factory=dict)
+    total: float = 0.0
+
+    def get(self, name: str) -> Any:
+        """The source's value; re-raises its error if it has none."""
+        if name in self.errors:
+            raise self.errors[name]
+        return self.values[name]
+
+    def describe(self) -> str:
+        """One log line: total, then each source, slowest first."""
+        parts = sorted(self.timings.items(), key=lambda item: -item[1].seconds)
+        breakdown = ", ".join(
+            f"{name} {timing.seconds:.2f}s"
+            + ("" if timing.outcome == FETCHED else f" [{timing.outcome}]")
+            for name, timing in parts
+        )
+        return f"{self.total:.2f}s ({breakdown})"
+
+
+class DataGatheringStage:
+    """Runs a set of DataSource fetches concurrently; see the module
+    docstring."""
+
+    def __init__(self, max_workers: int = 6):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="bess-gather"
+        )
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, Future[tuple[Any, float]]] = {}
+        self._last: dict[str, tuple[Hashable, Any]] = {}
+
+    def gather(self, sources: list[DataSource]) -> GatheredData:
+        """Fetch every source concurrently and wait for each until its
+        deadline."""
+        started = time.perf_counter()
+        result = GatheredData()
+        futures: dict[str, Future[tuple[Any, float]]] = {}
+        with self._lock:
+            for source in sources:
+                previous = self._in_flight.get(source.name)
+                if previous is not None and not previous.done():
+                    logger.warning(
+                        "Data source '%s' is still fetching from an earlier run",
+                        source.name,
+                    )
+                    continue
+                future = self._executor.submit(self._fetch, source)
+                self._in_flight[source.name] = future
+                futures[source.name] = future
+
+        for source in sources:
+            pending = futures.get(source.name)
+            try:
+                if pending is None:
+                    raise DataSourceTimeoutError(source.name, source.deadline)
+                timeout = (
+                    None
+                    if source.deadline is None
+                    else max(0.0, started + source.deadline - time.perf_counter())
+                )
+                try:
+                    value, seconds = pending.result(timeout=timeout)
+                except FutureTimeoutError:
+                    raise DataSourceTimeoutError(source.name, source.deadline) from None
+                result.values[source.name] = value
+                result.timings[source.name] = SourceTiming(seconds, FETCHED)
+            except Exception as e:
+                self._fall_back(source, e, time.perf_counter() - started, result)
+
+        result.total = time.perf_counter() - started
+        return result
+
+    def _fetch(self, source: DataSource) -> tuple[Any, float]:
+        """Worker body: run the fetch and remember its value for fallback."""
+        started = time.perf_counter()
+        value = source.fetch()
+        seconds = time.perf_counter() - started
+        with self._lock:
+            self._last[source.name] = (source.cache_key, value)
+        return value, seconds
+
+    def _fall_back(
+        self,
+        source: DataSource,
+        error: Exception,
+        waited: float,
+        result: GatheredData,
+    ) -> None:
+        with self._lock:
+            last = self._last.get(source.name)
+        if source.fallback and last is not None and last[0] == source.cache_key:
+            logger.warning(
+                "Data source '%s' unavailable (%s), using its last value",
+                source.name,
+                error,
+            )
+            result.values[source.name] = last[1]
+            result.timings[source.name] = SourceTiming(waited, CACHED)
+            return
+        result.errors[source.name] = error
+        result.timings[source.name] = SourceTiming(waited, FAILED)
@@ -557,6 +557,17 @@ Findings (top) and System Logs (bottom).*
 
 ```json
 {self._format_json(input_meta)}
+```"""
+
+        # Per-phase solve timings -- which phase to blame for an overrun
+        timings = opt_result.get("timings")
+        if timings:
+            econ_block += f"""
+
+### Solve Timings
+
+```json
+{self._format_json(timings)}
 ```"""
 
         # Period decisions table
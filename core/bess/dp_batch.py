@@ -0,0 +1,250 @@
+"""Batched backward induction over an ensemble of forecast scenarios.
+
+Robustness studies -- `verification.realized_under_solar_error`, the
+perturbed-fixture suites built on `tests/synthetic/perturb_scenario.py` --
+solve many variants of one day that differ only in their forecasts. Solved
+one at a time, every variant pays the full per-period numpy call overhead of
+the banded grid evaluation, which at production resolution is a large share
+of the backward pass.
+
+The grid primitives broadcast over a leading scenario axis (a period's
+prices, load and solar become (K, 1, 1) columns), so here one walk over the
+banded blocks advances all K value functions a period at a time. Each
+scenario's row of V is bit-identical to `_run_dynamic_programming` on that
+scenario alone: the stacking adds an axis, never a reduction across it.
+
+Only the backward induction is batched. Each schedule is then replayed from
+its own row of V by `optimize_battery_schedule`; the replay follows one
+continuous SoE trajectory per scenario and has no shared grid to vectorize.
+
+Everything that is not a forecast -- battery, derating, fuse, platform -- is
+shared by the whole ensemble, as it is for the day being studied.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.bess.dp_battery_algorithm import (
+    DPWorkspace,
+    _banded_grid_blocks,
+    _banded_period_values,
+    _bypass_column_values,
+    _cover_column_values,
+    _discretize_state_action_space,
+    _effective_ac_cap_kwh,
+    _effective_import_cap_kwh,
+    _period_invariant_masks,
+    optimize_battery_schedule,
+)
+from core.bess.execution_model import DEFAULT_CAPABILITIES, PlatformCapabilities
+from core.bess.models import OptimizationResult
+from core.bess.settings import BatterySettings, HomeSettings
+
+
+@dataclass(frozen=True)
+class ForecastScenario:
+    """One member of a forecast ensemble: the inputs that vary between
+    scenarios of the same day."""
+
+    buy_price: list[float]
+    sell_price: list[float]
+    home_consumption: list[float]
+    solar_production: list[float]
+    initial_soe: float | None = None
+    terminal_value_per_kwh: float = 0.0
+
+
+def batched_value_functions(
+    scenarios: list[ForecastScenario],
+    battery_settings: BatterySettings,
+    dt: float,
+    max_charge_power_per_period: list[float] | None = None,
+    import_cap_kwh: float | None = None,
+    capabilities: PlatformCapabilities = DEFAULT_CAPABILITIES,
+) -> np.ndarray:
+    """The backward induction's V for every scenario, shape
+    (K, horizon + 1, n_states); row k equals `_run_dynamic_programming` on
+    scenario k alone.
+
+    Raises ValueError for an empty ensemble or scenarios of unequal length.
+    """
+    # Deferred for the same reason as in _run_dynamic_programming:
+    # action_selector imports dp_battery_algorithm.
+    from core.bess.action_selector import (
+        _residual_cover_p,
+        _solar_export_bypass_is_unexecutable,
+    )
+
+    if not scenarios:
+        raise ValueError("batched_value_functions needs at least one scenario")
+    horizon = len(scenarios[0].buy_price)
+    for k, scenario in enumerate(scenarios):
+        lengths = {
+            len(scenario.buy_price),
+            len(scenario.sell_price),
+            len(scenario.home_consumption),
+            len(scenario.solar_production),
+        }
+        if lengths != {horizon}:
+            raise ValueError(
+                f"Scenario {k} has period inputs of length {sorted(lengths)}, "
+                f"expected {horizon} like scenario 0"
+            )
+
+    n_scenarios = len(scenarios)
+    buy_price = np.array([s.buy_price for s in scenarios], dtype=float)
+    sell_price = np.array([s.sell_price for s in scenarios], dtype=float)
+    home_consumption = np.array([s.home_consumption for s in scenarios], dtype=float)
+    solar_production = np.array([s.solar_production for s in scenarios], dtype=float)
+
+    soe_levels, power_levels = _discretize_state_action_space(battery_settings)
+    n_states = len(soe_levels)
+    soe_col = soe_levels.reshape(-1, 1)
+    power_row = power_levels.reshape(1, -1)
+    charge_feasible_base, discharge_feasible, max_discharge_power = (
+        _period_invariant_masks(soe_col, power_row, battery_settings, dt)
+    )
+    blocks = _banded_grid_blocks(power_levels, charge_feasible_base, discharge_feasible)
+    largest_block = max(block.charge_feasible_base.size for block in blocks)
+    workspace = DPWorkspace(n_scenarios * max(largest_block, n_states))
+    ac_cap_kwh = _effective_ac_cap_kwh(battery_settings, dt)
+
+    # Period-major so V[t + 1] is one contiguous (K, S) block.
+    V = np.zeros((horizon + 1, n_scenarios, n_states))
+    usable_energy = np.maximum(0.0, soe_levels - battery_settings.min_soe_kwh)
+    for k, scenario in enumerate(scenarios):
+        if scenario.terminal_value_per_kwh > 0.0:
+            V[horizon, k] = usable_energy * scenario.terminal_value_per_kwh
+
+    for t in reversed(range(horizon)):
+        buy_t = buy_price[:, t].reshape(-1, 1, 1)
+        sell_t = sell_price[:, t].reshape(-1, 1, 1)
+        home_t = home_consumption[:, t].reshape(-1, 1, 1)
+        solar_t = solar_production[:, t].reshape(-1, 1, 1)
+        V[t], effective_import_cap = _banded_period_values(
+            V[t + 1],
+            soe_col,
+            blocks,
+            battery_settings=battery_settings,
+            dt=dt,
+            buy_price=buy_t,
+            sell_price=sell_t,
+            home_consumption=home_t,
+            solar_production=solar_t,
+            period_max_charge=(
+                max_charge_power_per_period[t]
+                if max_charge_power_per_period is not None
+                else None
+            ),
+            ac_cap_kwh=ac_cap_kwh,
+            import_cap_kwh=import_cap_kwh,
+            workspace=workspace,
+        )
+
+        # The bypass and cover columns are conditional per period (see
+        # _run_dynamic_programming); batched, a scenario the condition
+        # excludes gets -inf for the column instead of skipping it.
+        bypass_allowed = np.array(
+            [
+                not _solar_export_bypass_is_unexecutable(
+                    solar_production[k, t], home_consumption[k, t], battery_settings, dt
+                )
+                for k in range(n_scenarios)
+            ]
+        )
+        if bypass_allowed.any():
+            bypass_values = _bypass_column_values(
+                V[t + 1],
+                soe_col,
+                battery_settings=battery_settings,
+                dt=dt,
+                buy_price=buy_t,
+                sell_price=sell_t,
+                home_consumption=home_t,
+                solar_production=solar_t,
+                import_cap_kwh=import_cap_kwh,
+                effective_import_cap=effective_import_cap,
+                workspace=workspace,
+            )
+            bypass_values[~bypass_allowed] = -np.inf
+            V[t] = np.maximum(V[t], bypass_values)
+
+        cover_ps = [
+            _residual_cover_p(
+                home_consumption[k, t],
+                solar_production[k, t],
+                dt,
+                capabilities,
+                battery_settings,
+            )
+            for k in range(n_scenarios)
+        ]
+        cover_allowed = np.array([cover_p is not None for cover_p in cover_ps])
+        if cover_allowed.any():
+            cover_values = _cover_column_values(
+                V[t + 1],
+                soe_col,
+                np.array(
+                    [cover_p if cover_p is not None else 0.0 for cover_p in cover_ps]
+                ).reshape(-1, 1, 1),
+                max_discharge_power,
+                battery_settings=battery_settings,
+                dt=dt,
+                buy_price=buy_t,
+                sell_price=sell_t,
+                home_consumption=home_t,
+                solar_production=solar_t,
+                ac_cap_kwh=ac_cap_kwh,
+                import_cap_kwh=import_cap_kwh,
+                effective_import_cap=effective_import_cap,
+                workspace=workspace,
+            )
+            cover_values[~cover_allowed] = -np.inf
+            V[t] = np.maximum(V[t], cover_values)
+
+    return np.ascontiguousarray(V.transpose(1, 0, 2))
+
+
+def optimize_battery_schedules(
+    scenarios: list[ForecastScenario],
+    battery_settings: BatterySettings,
+    period_duration_hours: float = 0.25,
+    max_charge_power_per_period: list[float] | None = None,
+    capabilities: PlatformCapabilities = DEFAULT_CAPABILITIES,
+    home_settings: HomeSettings | None = None,
+    currency: str = "SEK",
+) -> list[OptimizationResult]:
+    """`optimize_battery_schedule` for every scenario of a forecast ensemble,
+    with the backward inductions solved together.
+
+    Each result is identical to calling `optimize_battery_schedule` on that
+    scenario alone with the same shared arguments.
+    """
+    dt = period_duration_hours
+    V = batched_value_functions(
+        scenarios,
+        battery_settings,
+        dt,
+        max_charge_power_per_period=max_charge_power_per_period,
+        import_cap_kwh=_effective_import_cap_kwh(home_settings, dt),
+        capabilities=capabilities,
+    )
+    return [
+        optimize_battery_schedule(
+            buy_price=scenario.buy_price,
+            sell_price=scenario.sell_price,
+            home_consumption=scenario.home_consumption,
+            solar_production=scenario.solar_production,
+            battery_settings=battery_settings,
+            initial_soe=scenario.initial_soe,
+            period_duration_hours=dt,
+            terminal_value_per_kwh=scenario.terminal_value_per_kwh,
+            currency=currency,
+            max_charge_power_per_period=max_charge_power_per_period,
+            capabilities=capabilities,
+            home_settings=home_settings,
+            value_function=V[k],
+        )
+        for k, scenario in enumerate(scenarios)
+    ]
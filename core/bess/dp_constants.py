@@ -59,6 +59,12 @@ so it is not derived from POWER_STEP_KW and is not defined here).
 # synthetic_clear_sky_ac_clipping). Grid refinement is not per-fixture
 # monotone, so a finer grid is not automatically safer -- any future
 # refinement has to re-measure the per-fixture tail, not just the total.
+#
+# The backward pass itself has since been cut to the feasible band of the
+# state x action grid (dp_battery_algorithm.GRID_EVALUATION_BANDED): 27.0s
+# -> 10.0s of pure backward induction over the 39-fixture corpus at this
+# resolution, with V bit-identical. That moves the latency side of the
+# trade above; the per-fixture cost budget is unaffected.
 SOE_STEP_KWH = 0.025
 
 # Action space: power grid resolution (kW).
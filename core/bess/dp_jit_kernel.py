@@ -0,0 +1,136 @@
+"""Fused, optionally JIT-compiled kernel for one backward-induction period.
+
+`_grid_period_values` evaluates a period as a sequence of whole-grid numpy
+passes -- feasibility masks, transition, reward, the gather from `V[t+1]`,
+the max -- each materializing an (S, A) intermediate. This kernel walks the
+same state x action grid once, cell by cell, and keeps only the running
+import floor and best value per state.
+
+It does not restate the physics. Everything that is not per-cell is computed
+by the caller with the existing numpy primitives, and handed in as vectors:
+
+- STORE and IDLE cells depend only on the state (STORE physics are binary,
+  see `_state_transition_grid`), so their next_soe, reward and grid import
+  arrive per state.
+- Discharge reward and grid import depend only on the action, so they
+  arrive per action, with the discharge energy each action draws.
+
+The kernel itself only combines them: the discharge transition (the one
+genuinely (S, A) quantity), the masks, the #429 import floor, the lookup
+into `V_next` and the max. Each of those uses the same operations in the
+same order as the numpy pass, so V is bit-identical; the parity tests in
+`test_vectorized_backward_parity.py` pin that.
+
+numba is optional. It has no musllinux wheels, so the Alpine add-on image
+cannot install it; `JIT_AVAILABLE` is False there and callers fall back to
+the numpy evaluation. Without numba `fused_period_values` is the same
+function run as plain Python -- far too slow for a real solve, but exact,
+which is what lets the parity tests check the kernel everywhere.
+"""
+
+import numpy as np
+
+try:
+    import numba
+
+    JIT_AVAILABLE = True
+except ImportError:  # optional dependency, see the module docstring
+    JIT_AVAILABLE = False
+
+# Disposition codes in the kernel's per-action `kind` array.
+KIND_IDLE = 0
+KIND_STORE = 1
+KIND_DISCHARGE = 2
+
+
+def _fused_period_values(
+    V_next: np.ndarray,
+    soe: np.ndarray,
+    floor: np.ndarray,
+    kind: np.ndarray,
+    action_ok: np.ndarray,
+    charge_feasible_base: np.ndarray,
+    discharge_feasible: np.ndarray,
+    store_next_soe: np.ndarray,
+    idle_next_soe: np.ndarray,
+    store_reward: np.ndarray,
+    idle_reward: np.ndarray,
+    store_import: np.ndarray,
+    idle_import: np.ndarray,
+    discharge_energy: np.ndarray,
+    discharge_reward: np.ndarray,
+    discharge_import: np.ndarray,
+    min_soe: float,
+    max_soe: float,
+    soe_step: float,
+    import_cap: float,
+    values: np.ndarray,
+    effective_import_cap: np.ndarray,
+) -> None:
+    """Best value per state for one period, written into `values`.
+
+    With `import_cap` NaN there is no import cap and `effective_import_cap`
+    is left untouched; otherwise it receives the per-state cap after the
+    #429 floor, as `_grid_period_values` returns it.
+    """
+    n_states, n_actions = charge_feasible_base.shape
+    last_state = V_next.shape[0] - 1
+    has_import_cap = not np.isnan(import_cap)
+    next_soe = np.empty(n_actions)
+    feasible = np.empty(n_actions, dtype=np.bool_)
+
+    for s in range(n_states):
+        floor_import = np.inf
+        for a in range(n_actions):
+            ok = (
+                action_ok[a] and charge_feasible_base[s, a] and discharge_feasible[s, a]
+            )
+            if kind[a] == KIND_DISCHARGE:
+                drawn = min(discharge_energy[a], soe[s] - min_soe)
+                cell_next_soe = min(max_soe, max(floor[s], soe[s] - drawn))
+                cell_import = discharge_import[a]
+            elif kind[a] == KIND_STORE:
+                cell_next_soe = store_next_soe[s]
+                cell_import = store_import[s]
+            else:
+                cell_next_soe = idle_next_soe[s]
+                cell_import = idle_import[s]
+            ok = ok and cell_next_soe >= min_soe and cell_next_soe <= max_soe
+            next_soe[a] = cell_next_soe
+            feasible[a] = ok
+            if ok and cell_import < floor_import:
+                floor_import = cell_import
+
+        cap = np.inf
+        if has_import_cap:
+            cap = max(import_cap, floor_import)
+            effective_import_cap[s] = cap
+
+        best = -np.inf
+        for a in range(n_actions):
+            if not feasible[a]:
+                continue
+            if kind[a] == KIND_DISCHARGE:
+                reward = discharge_reward[a]
+                cell_import = discharge_import[a]
+            elif kind[a] == KIND_STORE:
+                reward = store_reward[s]
+                cell_import = store_import[s]
+            else:
+                reward = idle_reward[s]
+                cell_import = idle_import[s]
+            if has_import_cap and not cell_import <= cap + 1e-9:
+                continue
+            next_i = int(np.rint((next_soe[a] - min_soe) / soe_step))
+            next_i = min(max(next_i, 0), last_state)
+            value = reward + V_next[next_i]
+            if value > best:
+                best = value
+        values[s] = best
+
+
+fused_period_values = (
+    numba.njit(cache=True)(_fused_period_values)
+    if JIT_AVAILABLE
+    else _fused_period_values
+)
@@ -0,0 +1,139 @@
+"""Warm-start cache for the grid DP's value function across quarterly re-solves.
+
+Row `t` of the backward induction's `V` depends only on the per-period inputs
+at `t` and later, the terminal row, and a handful of solve-wide parameters
+(battery, dt, import cap, platform capabilities). Nothing earlier in the
+horizon -- and in particular neither the initial SOE nor the initial cost
+basis -- enters it. So two solves whose horizons share a common *tail* of
+identical period inputs share the corresponding trailing rows of `V` exactly,
+bit for bit, and only the rows in front of the last changed period need
+recomputing.
+
+That is the quarterly shape: each `update_schedule_quarterly` run slices the
+horizon from the current period, so consecutive solves end at the same period
+and differ mostly in the first few periods' forecasts (the newly observed
+SOE, a refreshed near-term consumption estimate). The tail is therefore
+aligned from the *end* of the horizon, not the start -- a re-solve one period
+later is one row shorter at the front, not shifted at the back.
+
+Reuse is all-or-nothing per row and keyed on exact input equality, never on
+a tolerance: a cached row is only handed back when recomputing it would
+produce the identical floats, so a warm start cannot change any plan.
+"""
+
+from dataclasses import astuple
+from typing import Any
+
+import numpy as np
+
+from core.bess.execution_model import PlatformCapabilities
+from core.bess.settings import BatterySettings
+
+PeriodKey = tuple[float, float, float, float, float | None]
+
+
+class DPValueCache:
+    """The last solve's value function and the inputs it was computed from.
+
+    Holds exactly one solve: a warm start only ever looks at the immediately
+    preceding quarterly run, and keeping more would grow memory for rows no
+    later horizon can share.
+    """
+
+    def __init__(self) -> None:
+        self._context: tuple[Any, ...] | None = None
+        self._period_keys: list[PeriodKey] = []
+        self._V: np.ndarray | None = None
+
+    @staticmethod
+    def context_key(
+        battery_settings: BatterySettings,
+        dt: float,
+        terminal_value_per_kwh: float,
+        import_cap_kwh: float | None,
+        capabilities: PlatformCapabilities,
+        n_states: int,
+    ) -> tuple[Any, ...]:
+        """Solve-wide inputs every row of `V` depends on.
+
+        `battery_settings` is snapshotted by value: it is a mutable dataclass
+        that `update_settings` edits in place, so holding the object itself
+        would make a stale cache compare equal to the new settings.
+        """
+        return (
+            astuple(battery_settings),
+            dt,
+            terminal_value_per_kwh,
+            import_cap_kwh,
+            capabilities,
+            n_states,
+        )
+
+    @staticmethod
+    def period_keys(
+        buy_price: list[float],
+        sell_price: list[float],
+        home_consumption: list[float],
+        solar_production: list[float],
+        max_charge_power_per_period: list[float] | None,
+    ) -> list[PeriodKey]:
+        """Per-period inputs row `t` of `V` is computed from."""
+        return [
+            (
+                float(buy_price[t]),
+                float(sell_price[t]),
+                float(home_consumption[t]),
+                float(solar_production[t]),
+                (
+                    float(max_charge_power_per_period[t])
+                    if max_charge_power_per_period is not None
+                    else None
+                ),
+            )
+            for t in range(len(buy_price))
+        ]
+
+    def reusable_rows(
+        self, context: tuple[Any, ...], period_keys: list[PeriodKey]
+    ) -> int:
+        """Index of the first row of the new `V` that can be copied from the
+        cached solve; `len(period_keys) + 1` when nothing (not even the
+        terminal row) is reusable.
+
+        Rows from the returned index through the terminal row inclusive match
+        the cached solve's trailing rows exactly.
+        """
+        horizon = len(period_keys)
+        if self._V is None or context != self._context:
+            return horizon + 1
+        shared = 0
+        cached = self._period_keys
+        while (
+            shared < min(horizon, len(cached))
+            and period_keys[horizon - 1 - shared] == cached[len(cached) - 1 - shared]
+        ):
+            shared += 1
+        return horizon - shared
+
+    def fill(self, V: np.ndarray, first_row: int) -> None:
+        """Copy the cached trailing rows into `V[first_row:]`."""
+        if self._V is None:
+            raise ValueError("DPValueCache.fill called on an empty cache")
+        n_rows = V.shape[0] - first_row
+        V[first_row:] = self._V[self._V.shape[0] - n_rows :]
+
+    def store(
+        self,
+        context: tuple[Any, ...],
+        period_keys: list[PeriodKey],
+        V: np.ndarray,
+    ) -> None:
+        """Remember a completed solve as the base for the next warm start."""
+        self._context = context
+        self._period_keys = list(period_keys)
+        self._V = V.copy()
+
+    def clear(self) -> None:
+        self._context = None
+        self._period_keys = []
+        self._V = None
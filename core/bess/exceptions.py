@@ -57,6 +57,20 @@ class HistoricalDataUnavailableError(BESSException):
         super().__init__(message or "Historical energy-flow data is not available")
 
 
+class DataSourceTimeoutError(BESSException):
+    """Raised when an optimization input source misses its fetch deadline
+    and there is no earlier value to fall back to."""
+
+    def __init__(self, source: str, deadline: float | None):
+        super().__init__(
+            f"Data source '{source}' did not respond within {deadline}s"
+            if deadline is not None
+            else f"Data source '{source}' is still fetching from an earlier run"
+        )
+        self.source = source
+        self.deadline = deadline
+
+
 class PWLWindowUnderRefinedError(RuntimeError):
     """The windowed PWL solve hit one of its own accuracy budgets, so the
     value table it would return is an approximation of unknown quality.
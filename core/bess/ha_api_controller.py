@@ -10,14 +10,19 @@ import re
 import ssl
 import time
 import urllib.parse
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
 from functools import partial
 from typing import ClassVar
 
 import requests
 import websocket
 
+from . import time_utils
 from .energy_balance import derive_load_consumption
 from .exceptions import SystemConfigurationError
+from .ha_state_cache import HAStateCache, websocket_url
 from .runtime_failure_tracker import RuntimeFailureTracker
 from .settings_store import SettingsStore, apply_signed_pair_aliases
 
@@ -50,6 +55,34 @@ def run_request(http_method, *args, **kwargs):
         raise
 
 
+@dataclass(frozen=True)
+class SensorSnapshot:
+    """Raw states of several sensors read at one instant.
+
+    Attributes:
+        taken_at: When the states were read
+        entity_ids: sensor_key -> entity_id for each requested, configured key
+        states: entity_id -> raw HA state string (including "unavailable")
+    """
+
+    taken_at: datetime
+    entity_ids: dict[str, str]
+    states: dict[str, str]
+
+    def value(self, sensor_key: str) -> float | None:
+        """Numeric state of sensor_key, or None if unconfigured or non-numeric.
+
+        "unavailable" and "unknown" are non-numeric, so they read as None the
+        same way ``_get_sensor_value`` reports them.
+        """
+        entity_id = self.entity_ids.get(sensor_key)
+        raw = self.states.get(entity_id) if entity_id else None
+        try:
+            return float(raw) if raw is not None else None
+        except ValueError:
+            return None
+
+
 class HomeAssistantAPIController:
     """A class for interacting with Inverter controls via Home Assistant REST API."""
 
@@ -149,6 +182,9 @@ class HomeAssistantAPIController:
         self.session = requests.Session()
         self.session.headers.update(self.headers)
 
+        # WebSocket-fed state cache for live reads (see start_state_cache)
+        self.state_cache: HAStateCache | None = None
+
         logger.info(
             "Initialized HomeAssistantAPIController with %d sensor mappings",
             len(self.sensors),
@@ -1128,12 +1164,144 @@ class HomeAssistantAPIController:
         Returns:
             Full HA state dict, or None if the entity does not exist
         """
-        return self._api_request(
+        return self._get_state(
+            entity_id,
+            operation=f"Fetch raw state for '{entity_id}'",
+            category="sensor_read",
+        )
+
+    def start_state_cache(self) -> None:
+        """Serve live reads from a WebSocket ``state_changed`` subscription.
+
+        Starts a background connection that caches the state of every
+        configured sensor. Reads go through ``_get_state`` and fall back to
+        REST whenever the subscription is down. Call once at startup.
+        """
+        if self.state_cache is None:
+            self.state_cache = HAStateCache(
+                websocket_url(self.base_url),
+                self.token,
+                tracked_entities=lambda: self.sensors.values(),
+            )
+        self.state_cache.start()
+
+    def _get_state(self, entity_id: str, operation: str, category: str) -> dict | None:
+        """Current HA state dict for an entity, from the state cache or REST.
+
+        Only for live reads. Read-back after a write goes straight to REST
+        (``_api_request``) because the cache may not have seen the write's
+        ``state_changed`` event yet.
+        """
+        if self.state_cache is not None:
+            cached = self.state_cache.get(entity_id)
+            if cached is not None:
+                return cached
+        response = self._api_request(
             "get",
             f"/api/states/{entity_id}",
-            operation=f"Fetch raw state for '{entity_id}'",
+            operation=operation,
+            category=category,
+        )
+        if self.state_cache is not None and response:
+            self.state_cache.offer(response)
+        return response
+
+    def snapshot(self, sensor_keys: Iterable[str]) -> SensorSnapshot:
+        """Read the current state of several sensors at one instant.
+
+        Each key is resolved once and a shared entity is read once. While
+        the state cache is subscribed, the states come from it under a
+        single lock. Otherwise one ``POST /api/template`` renders them all
+        together. Either way, the values are mutually consistent instead of
+        being taken seconds apart by one GET per sensor.
+
+        Args:
+            sensor_keys: Sensor keys to read; unconfigured keys are left out
+
+        Returns:
+            SensorSnapshot; an entity that does not exist reads as "unknown"
+
+        Raises:
+            requests.RequestException: If the template render fails
+        """
+        entity_ids: dict[str, str] = {}
+        for sensor_key in sensor_keys:
+            try:
+                entity_ids[sensor_key], _ = self._resolve_entity_id(sensor_key)
+            except ValueError:
+                logger.debug("Snapshot skips unconfigured sensor %s", sensor_key)
+        unique_ids = list(dict.fromkeys(entity_ids.values()))
+
+        states = self.state_cache.states(unique_ids) if self.state_cache else None
+        if states is None:
+            states = self._render_states(unique_ids)
+        else:
+            # Entities configured after the subscription started are read
+            # once over REST, which adopts them into the cache.
+            for entity_id in unique_ids:
+                if entity_id not in states:
+                    response = self._get_state(
+                        entity_id,
+                        operation=f"Read state for '{entity_id}'",
+                        category="sensor_read",
+                    )
+                    states[entity_id] = (
+                        str(response.get("state")) if response else "unknown"
+                    )
+
+        return SensorSnapshot(
+            taken_at=time_utils.now(), entity_ids=entity_ids, states=states
+        )
+
+    def _render_states(self, entity_ids: list[str]) -> dict[str, str]:
+        """Raw states of entity_ids from a single HA template render."""
+        if not entity_ids:
+            return {}
+        template = (
+            "{"
+            + ", ".join(
+                f'"{entity_id}": {{{{ states({entity_id!r}) | to_json }}}}'
+                for entity_id in entity_ids
+            )
+            + "}"
+        )
+        rendered = self._api_request(
+            "post",
+            "/api/template",
+            operation="Read sensor snapshot",
             category="sensor_read",
+            json={"template": template},
         )
+        return {
+            entity_id: str(state) for entity_id, state in json.loads(rendered).items()
+        }
+
+    def power_from_snapshot(
+        self, snapshot: SensorSnapshot, sensor_key: str
+    ) -> float | None:
+        """Power reading for sensor_key (W), as its live getter would return it.
+
+        Applies the same shared-signed-entity split as get_import_power,
+        get_export_power, get_battery_charge_power and
+        get_battery_discharge_power; any other key is its plain value.
+        """
+        if sensor_key in ("import_power", "export_power"):
+            if self._is_shared_signed_grid_power():
+                raw = snapshot.value("import_power")
+                if raw is None:
+                    return None
+                return self._split_signed_grid_power(
+                    raw, importing=sensor_key == "import_power"
+                )
+        elif sensor_key in ("battery_charge_power", "battery_discharge_power"):
+            if self._is_shared_signed_battery_power():
+                raw = snapshot.value("battery_charge_power")
+                if raw is None:
+                    return None
+                return self._split_signed_battery_power(
+                    raw, charging=sensor_key == "battery_charge_power"
+                )
+        return snapshot.value(sensor_key)
 
     def _api_request(
         self,
@@ -1188,6 +1356,11 @@ class HomeAssistantAPIController:
                     and response.headers.get("content-type") == "application/json"
                 ):
                     return response.json()
+                # POST /api/template answers with the rendered text
+                if response.content and response.headers.get(
+                    "content-type", ""
+                ).startswith("text/plain"):
+                    return response.text
                 return None
 
             except requests.RequestException as e:
@@ -1384,9 +1557,8 @@ class HomeAssistantAPIController:
 
         try:
             failure_category = f"sensor_read:{sensor_name}"
-            response = self._api_request(
-                "get",
-                f"/api/states/{entity_id}",
+            response = self._get_state(
+                entity_id,
                 operation=f"Read sensor '{sensor_name}'",
                 category=failure_category,
             )
@@ -1635,9 +1807,8 @@ class HomeAssistantAPIController:
         """
         try:
             entity_id = self._get_entity_for_service("grid_charge")
-            response = self._api_request(
-                "get",
-                f"/api/states/{entity_id}",
+            response = self._get_state(
+                entity_id,
                 operation="Check grid charge state",
                 category="sensor_read",
             )
@@ -2579,7 +2750,7 @@ class HomeAssistantAPIController:
 
         return quarterly_values
 
-    def get_solar_forecast(self):
+    def get_solar_forecast(self) -> list[float]:
         """Get solar forecast data in quarterly resolution (96 periods).
 
         Fetches hourly solar forecast from Solcast integration and upscales to
@@ -2629,9 +2800,8 @@ class HomeAssistantAPIController:
                 entity_id, _ = self._resolve_entity_id(sensor)
 
                 # Get sensor state
-                response = self._api_request(
-                    "get",
-                    f"/api/states/{entity_id}",
+                response = self._get_state(
+                    entity_id,
                     operation=f"Get sensor data for '{sensor}'",
                     category="sensor_read",
                 )
@@ -2848,8 +3018,7 @@ class HomeAssistantAPIController:
         Returns:
             List of result dicts, one per command, in the same order.
         """
-        ws_url = self.base_url.replace("https://", "wss://").replace("http://", "ws://")
-        ws_url = ws_url.rstrip("/") + "/api/websocket"
+        ws_url = websocket_url(self.base_url)
 
         sslopt = {}
         if ws_url.startswith("wss://"):
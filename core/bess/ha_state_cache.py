@@ -0,0 +1,249 @@
+"""In-memory Home Assistant entity state cache fed over the WebSocket API.
+
+One long-lived WebSocket connection subscribes to ``state_changed`` and keeps
+the latest state dict of every entity BESS reads. Live getters read from the
+cache instead of issuing a REST ``GET /api/states/{entity_id}`` per sensor,
+so the every-minute jobs (``sample_live_power``, ``apply_discharge_inhibit``)
+and the 5-minute ``adjust_charging_power`` cost no round trips in steady
+state.
+
+Design:
+- The cache only answers while the subscription is live. HA pushes an event
+  for every state or attribute change, so while subscribed a cached state is
+  current no matter how old its timestamp. On disconnect the cache is
+  cleared and every read falls back to REST until the next subscription is
+  confirmed.
+- Entities are seeded from ``get_states`` for the tracked set at connect
+  time. An entity configured later enters the cache from its first REST read
+  (``offer``), after which its ``state_changed`` events keep it current.
+- Events for entities not in the cache are dropped with a single dict lookup,
+  so a busy HA instance costs one JSON decode per event.
+- Thread-safe: the WebSocket runs on its own daemon thread, getters run on
+  the scheduler's workers.
+"""
+
+import json
+import logging
+import ssl
+import threading
+import time
+from collections.abc import Callable, Iterable
+
+import websocket
+
+logger = logging.getLogger(__name__)
+
+_SUBSCRIBE_ID = 1
+_GET_STATES_ID = 2
+
+
+def websocket_url(base_url: str) -> str:
+    """Return the WebSocket API URL for a Home Assistant base URL."""
+    ws_url = base_url.replace("https://", "wss://").replace("http://", "ws://")
+    return ws_url.rstrip("/") + "/api/websocket"
+
+
+class HAStateCache:
+    """Latest HA state dicts for the tracked entities, kept by subscription.
+
+    ``get`` returns the same dict ``GET /api/states/{entity_id}`` would, or
+    None when the caller must fall back to REST (not subscribed, or entity
+    not cached yet).
+    """
+
+    PING_INTERVAL_SECONDS = 30
+    PING_TIMEOUT_SECONDS = 10
+    RECONNECT_DELAYS_SECONDS = (5, 15, 60, 300)
+
+    def __init__(
+        self,
+        ws_url: str,
+        token: str,
+        tracked_entities: Callable[[], Iterable[str]],
+    ) -> None:
+        """Initialize an idle cache; ``start`` opens the subscription.
+
+        Args:
+            ws_url: HA WebSocket API URL (see ``websocket_url``)
+            token: Long-lived access token for Home Assistant
+            tracked_entities: Returns the entity IDs to seed on each connect,
+                read live so a settings change applies on the next reconnect
+        """
+        self._ws_url = ws_url
+        self._token = token
+        self._tracked_entities = tracked_entities
+        self._states: dict[str, tuple[dict, float]] = {}
+        self._live = False
+        self._subscribed = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._app: websocket.WebSocketApp | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def live(self) -> bool:
+        """Whether the subscription is confirmed and the cache is answering."""
+        return self._live
+
+    def get(self, entity_id: str) -> dict | None:
+        """Return the cached state dict, or None to fall back to REST."""
+        with self._lock:
+            if not self._live:
+                return None
+            entry = self._states.get(entity_id)
+        return entry[0] if entry else None
+
+    def states(self, entity_ids: Iterable[str]) -> dict[str, str] | None:
+        """Raw state strings of the cached entities among entity_ids.
+
+        Read under one lock, so the values are mutually consistent. Entities
+        not cached are left out; None when not subscribed.
+        """
+        with self._lock:
+            if not self._live:
+                return None
+            return {
+                entity_id: str(entry[0].get("state"))
+                for entity_id in entity_ids
+                if (entry := self._states.get(entity_id))
+            }
+
+    def age(self, entity_id: str) -> float | None:
+        """Seconds since the entity's state was last received, or None."""
+        with self._lock:
+            entry = self._states.get(entity_id)
+        return time.monotonic() - entry[1] if entry else None
+
+    def offer(self, state: dict) -> None:
+        """Adopt a state read over REST so later events keep it current.
+
+        Ignored when not subscribed, and when the entity is already cached —
+        an event that landed while the REST call was in flight is newer.
+        """
+        entity_id = state.get("entity_id")
+        if not entity_id:
+            return
+        with self._lock:
+            if self._live and entity_id not in self._states:
+                self._states[entity_id] = (state, time.monotonic())
+
+    def start(self) -> None:
+        """Start the subscription thread (no-op if already running)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="ha-state-cache", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Close the subscription and stop reconnecting."""
+        self._stop.set()
+        if self._app is not None:
+            self._app.close()
+        self._go_stale()
+
+    def _run(self) -> None:
+        sslopt = (
+            {"cert_reqs": ssl.CERT_REQUIRED}
+            if self._ws_url.startswith("wss://")
+            else {}
+        )
+        failures = 0
+        while not self._stop.is_set():
+            self._app = websocket.WebSocketApp(
+                self._ws_url,
+                on_message=self._on_message,
+                on_error=lambda _ws, error: logger.debug(
+                    "HA state cache WebSocket error: %s", error
+                ),
+            )
+            self._app.run_forever(
+                sslopt=sslopt,
+                ping_interval=self.PING_INTERVAL_SECONDS,
+                ping_timeout=self.PING_TIMEOUT_SECONDS,
+            )
+            was_live = self._go_stale()
+            failures = 0 if was_live else failures + 1
+            delay = self.RECONNECT_DELAYS_SECONDS[
+                min(failures, len(self.RECONNECT_DELAYS_SECONDS) - 1)
+            ]
+            if not self._stop.is_set():
+                logger.info(
+                    "HA state cache disconnected, reads use REST; reconnecting in %ds",
+                    delay,
+                )
+            self._stop.wait(delay)
+
+    def _on_message(self, ws: websocket.WebSocketApp, text: str) -> None:
+        self._handle(json.loads(text), ws.send)
+
+    def _handle(self, message: dict, send: Callable[[str], object]) -> None:
+        """Advance the auth/subscribe handshake or apply one pushed message."""
+        kind = message.get("type")
+        if kind == "event":
+            data = message["event"]["data"]
+            self._apply_event(data["entity_id"], data.get("new_state"))
+        elif kind == "auth_required":
+            send(json.dumps({"type": "auth", "access_token": self._token}))
+        elif kind == "auth_ok":
+            # Subscribe before the snapshot: anything that changes after
+            # get_states is taken arrives as an event behind its result.
+            send(
+                json.dumps(
+                    {
+                        "id": _SUBSCRIBE_ID,
+                        "type": "subscribe_events",
+                        "event_type": "state_changed",
+                    }
+                )
+            )
+            send(json.dumps({"id": _GET_STATES_ID, "type": "get_states"}))
+        elif kind == "auth_invalid":
+            logger.error(
+                "HA state cache authentication failed: %s", message.get("message")
+            )
+        elif kind == "result":
+            if not message.get("success"):
+                logger.warning(
+                    "HA state cache command %s failed, reads stay on REST: %s",
+                    message.get("id"),
+                    message.get("error"),
+                )
+            elif message.get("id") == _SUBSCRIBE_ID:
+                self._subscribed = True
+            elif message.get("id") == _GET_STATES_ID and self._subscribed:
+                # HA answers commands in order, so an unconfirmed subscription
+                # here has failed: without events the snapshot would go stale.
+                self._seed(message["result"])
+
+    def _seed(self, states: list[dict]) -> None:
+        tracked = set(self._tracked_entities())
+        received_at = time.monotonic()
+        with self._lock:
+            self._states = {
+                state["entity_id"]: (state, received_at)
+                for state in states
+                if state.get("entity_id") in tracked
+            }
+            self._live = True
+        logger.info("HA state cache subscribed, caching %d entities", len(self._states))
+
+    def _apply_event(self, entity_id: str, new_state: dict | None) -> None:
+        with self._lock:
+            if entity_id not in self._states:
+                return
+            if new_state is None:
+                del self._states[entity_id]
+            else:
+                self._states[entity_id] = (new_state, time.monotonic())
+
+    def _go_stale(self) -> bool:
+        """Stop answering and drop all states; return whether it was live."""
+        with self._lock:
+            was_live = self._live
+            self._live = False
+            self._subscribed = False
+            self._states = {}
+        return was_live
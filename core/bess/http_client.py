@@ -0,0 +1,55 @@
+"""Shared, pooled HTTP sessions for BESS's outbound requests.
+
+A bare ``requests.post`` opens (and for HTTPS, handshakes) a new connection
+on every call. The InfluxDB queries and the weather forecast fetch run every
+quarter, so each paid connection setup on every run. This module keeps one
+keep-alive ``requests.Session`` per host, shared by every caller that talks
+to that host.
+
+Design:
+- One session per scheme://host[:port], created on first use and kept for
+  the life of the process.
+- Each session's connection pool holds at most MAX_CONNECTIONS_PER_HOST
+  connections and blocks instead of opening more, so concurrent callers
+  (e.g. parallel data-gathering workers) cannot flood a single host.
+- Sessions carry no default headers or auth: callers pass their own per
+  request, so different credentials for the same host never mix.
+
+HomeAssistantAPIController keeps its own session, since that session carries
+its token as a default header.
+"""
+
+import threading
+import urllib.parse
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+MAX_CONNECTIONS_PER_HOST = 4
+
+_sessions: dict[str, requests.Session] = {}
+_lock = threading.Lock()
+
+
+def session_for(url: str) -> requests.Session:
+    """Return the shared keep-alive session for url's scheme and host."""
+    parts = urllib.parse.urlsplit(url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    with _lock:
+        session = _sessions.get(origin)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=MAX_CONNECTIONS_PER_HOST,
+                pool_block=True,
+            )
+            session.mount(f"{origin}/", adapter)
+            _sessions[origin] = session
+    return session
+
+
+def post(url: str, **kwargs: Any) -> requests.Response:
+    """``requests.post`` over the shared session for url's host."""
+    return session_for(url).post(url, **kwargs)
@@ -12,7 +12,7 @@ from zoneinfo import ZoneInfo
 
 import requests
 
-from core.bess import time_utils
+from core.bess import http_client, time_utils
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -118,7 +118,7 @@ def test_influxdb_connection() -> dict:
     headers = {"Content-type": "application/vnd.flux", "Accept": "application/csv"}
 
     try:
-        response = requests.post(
+        response = http_client.post(
             url=url,
             auth=(username, password),
             headers=headers,
@@ -247,7 +247,7 @@ def get_sensor_data(sensors_list, start_time=None, stop_time=None) -> dict:
 
     try:
         # Use the environment-aware executor to make the request
-        response = requests.post(
+        response = http_client.post(
             url=url,
             auth=(username, password),
             headers=headers,
@@ -470,7 +470,7 @@ def get_sensor_data_batch(sensors_list, target_date) -> dict:
         )
         _LOGGER.info("Querying sensors: %s", sensors_list)
 
-        response = requests.post(
+        response = http_client.post(
             url=url,
             auth=(username, password),
             headers=headers,
@@ -803,7 +803,7 @@ def get_power_sensor_data_batch(power_sensors: list[str], target_date) -> dict:
             len(power_sensors),
         )
 
-        response = requests.post(
+        response = http_client.post(
             url=url,
             auth=(username, password),
             headers=headers,
@@ -11,6 +11,8 @@ import logging
 from dataclasses import dataclass, field, replace
 from datetime import datetime
 
+from core.bess.solve_timings import SolveTimings
+
 logger = logging.getLogger(__name__)
 
 # Energy resolution floor for grid flows (kWh). Home Assistant's lifetime
@@ -578,3 +580,6 @@ class OptimizationResult:
     # schedule and results constructed directly in tests carry no reward
     # accumulation. It is never a degraded stand-in for a real value.
     reward_objective_cost: float | None = None
+    # Where the solve's wall-clock time went, per phase (see solve_timings.py).
+    # `None` on results not produced by `optimize_battery_schedule`, as above.
+    timings: SolveTimings | None = None
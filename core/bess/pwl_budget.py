@@ -0,0 +1,147 @@
+"""Deadline-aware ordering of the #450 PWL window re-solves.
+
+`tie_detection.TIE_NOISE_FACTOR` is a fixed trade-off: 0.1x the grid-snap
+noise flags 1% of periods, and every period between 0.1x and 1.0x is a
+decision grid-snapping could have flipped but is knowingly left alone
+because re-solving it costs 20-40x the grid DP's latency. A fixed factor is
+wrong in both directions at once -- it wastes headroom on a fast host, and
+on a slow one a day with many windows can still push the quarterly solve
+past the scheduler's 30 s `misfire_grace_time`.
+
+`PWLWindowQueue` hands the window loop in `optimize_battery_schedule` its
+windows under a per-solve deadline instead:
+
+- windows are ranked by value at stake (`window_stake`) and re-solved in
+  that order, so when the deadline cuts the loop short it is the cheapest
+  possible mis-rankings that stay unresolved;
+- once every window at TIE_NOISE_FACTOR is resolved and time remains, the
+  detection band is widened through ESCALATION_NOISE_FACTORS and the newly
+  flagged windows are re-solved the same way;
+- every window not started before the deadline is reported as skipped.
+
+A skipped window keeps the grid DP's schedule, exactly as a period between
+0.1x and 1.0x does today: it is the same accepted false-negative risk
+TIE_NOISE_FACTOR documents, taken per solve instead of per constant, and it
+is logged and itemised in the solve's timings rather than left silent. The
+deadline is checked before each window, never inside one, so a solve can
+overrun it by at most the window in flight -- one window being bounded by
+#624's bisection.
+
+Without a deadline the queue is the plain detection-order FIFO the loop
+always used and never escalates, so an unbudgeted solve is unchanged.
+"""
+
+import time
+from collections.abc import Sequence
+
+from core.bess import tie_detection
+from core.bess.tie_detection import TIE_NOISE_FACTOR, Window
+
+# Detection thresholds tried, in order, once every window flagged at
+# TIE_NOISE_FACTOR has been re-solved with time to spare. Taken from the
+# k-sweep in tie_detection: 2.2%, 6.0% and 10.7% of periods flagged
+# suite-wide, the last being the full worst-case snap noise.
+ESCALATION_NOISE_FACTORS = (0.2, 0.5, 1.0)
+
+
+def window_stake(
+    window: Window,
+    tie_margins: Sequence[float],
+    value_slopes: Sequence[float],
+    soe_step_kwh: float,
+) -> float:
+    """Value (currency) the grid snap could have mis-ranked inside `window`.
+
+    Per period, the part of the worst-case snap noise
+    (`soe_step_kwh x |dV/dSoE|`) that its margin does not cover: a margin
+    of zero puts the whole noise at stake, a margin at or above it nothing.
+    Padding periods and infinite margins contribute nothing.
+    """
+    return sum(
+        max(0.0, soe_step_kwh * abs(value_slopes[t]) - tie_margins[t])
+        for t in range(window.start, window.end)
+    )
+
+
+class PWLWindowQueue:
+    """The windows left to re-solve, in the order they should be solved.
+
+    `deadline` is a `time.perf_counter()` reading, or None for no budget.
+    Items are `(window, noise_factor)`, the factor being the detection
+    threshold that flagged the window.
+    """
+
+    def __init__(
+        self,
+        windows: list[Window],
+        tie_margins: Sequence[float],
+        value_slopes: Sequence[float],
+        soe_step_kwh: float,
+        deadline: float | None = None,
+    ):
+        self._tie_margins = tie_margins
+        self._value_slopes = value_slopes
+        self._soe_step_kwh = soe_step_kwh
+        self._deadline = deadline
+        self._escalations = (
+            list(ESCALATION_NOISE_FACTORS) if deadline is not None else []
+        )
+        self._pending = [(w, TIE_NOISE_FACTOR) for w in self._ranked(windows)]
+        self.resolved: list[Window] = []
+        self.skipped: list[tuple[Window, float]] = []
+
+    def _ranked(self, windows: list[Window]) -> list[Window]:
+        if self._deadline is None:
+            return list(windows)
+        # Stable sort: equal stakes keep detection (start) order.
+        return sorted(
+            windows,
+            key=lambda w: -window_stake(
+                w, self._tie_margins, self._value_slopes, self._soe_step_kwh
+            ),
+        )
+
+    def pop(self) -> tuple[Window, float] | None:
+        """The next window to solve, or None when done or out of time."""
+        while True:
+            if self._deadline is not None and time.perf_counter() >= self._deadline:
+                self.skipped.extend(self._pending)
+                self._pending = []
+                self._escalations = []
+                return None
+            if self._pending:
+                return self._pending.pop(0)
+            if not self._escalate():
+                return None
+
+    def push_front(self, window: Window, noise_factor: float) -> None:
+        """Solve `window` next -- a bisected half (#624) of the one just popped."""
+        self._pending.insert(0, (window, noise_factor))
+
+    def mark_resolved(self, window: Window) -> None:
+        self.resolved.append(window)
+
+    def _escalate(self) -> bool:
+        """Queue the windows the next wider threshold adds, if any.
+
+        A window that overlaps or touches one already re-solved is dropped:
+        the splice pins a window to the schedule's SOE at both ends, and a
+        resolved neighbour may have moved exactly that state. Its most tied
+        periods were settled exactly by the narrower window anyway.
+        """
+        while self._escalations:
+            noise_factor = self._escalations.pop(0)
+            fresh = [
+                w
+                for w in tie_detection.detect_tie_windows(
+                    list(self._tie_margins),
+                    list(self._value_slopes),
+                    soe_step_kwh=self._soe_step_kwh,
+                    noise_factor=noise_factor,
+                )
+                if all(w.end < r.start or w.start > r.end for r in self.resolved)
+            ]
+            if fresh:
+                self._pending = [(w, noise_factor) for w in self._ranked(fresh)]
+                return True
+        return False
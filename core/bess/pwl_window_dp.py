@@ -83,6 +83,23 @@ def _pwl_prune(xs: np.ndarray, vs: np.ndarray, eps: float = PWL_EPS_PRUNE):
     return xs, vs
 
 
+def _merge_breakpoints(
+    X: np.ndarray, V_t: np.ndarray, probes: np.ndarray, probe_values: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Insert evaluated probes into a row's sorted breakpoints, dropping any
+    point within `_PWL_MERGE_EPS_KWH` of its left neighbour.
+
+    Every value is already known -- each state's Bellman value is computed
+    independently of the others -- so refinement never re-evaluates the
+    breakpoints it keeps, only the probes it adds."""
+    xs = np.concatenate((X, probes))
+    vs = np.concatenate((V_t, probe_values))
+    order = np.argsort(xs, kind="stable")
+    xs, vs = xs[order], vs[order]
+    keep = np.concatenate(([True], np.diff(xs) > _PWL_MERGE_EPS_KWH))
+    return xs[keep], vs[keep]
+
+
 def _backward_discharge_levels(
     battery_settings: BatterySettings,
     capabilities: PlatformCapabilities,
@@ -249,7 +266,14 @@ def _pwl_candidate_values_at(
         effective_import_cap = np.maximum(import_cap_kwh, floor_grid_imported)
         feasible &= grid_imported <= effective_import_cap + 1e-9
 
-    value = reward + _pwl_eval_array(V_next, next_soe)
+    # Every continuation value this period needs -- each candidate's next
+    # SOE, then the bypass's unchanged SOE -- in one evaluation. Transposed
+    # so queries run action by action: within an action next_soe rises with
+    # soe, so consecutive lookups land in neighbouring segments.
+    continuation = _pwl_eval_array(
+        V_next, np.concatenate((next_soe, soe_col), axis=1).T
+    ).T
+    value = reward + continuation[:, :-1]
     value = np.where(feasible, value, -np.inf)
 
     # SOLAR_EXPORT-below-max candidate (#313): soe held exactly unchanged
@@ -283,7 +307,7 @@ def _pwl_candidate_values_at(
         solar_production=solar_production[t],
         import_cap_kwh=import_cap_kwh,
     )
-    value_bypass = reward_bypass + _pwl_eval_array(V_next, soe_col)
+    value_bypass = reward_bypass + continuation[:, -1:]
     if effective_import_cap is not None:
         value_bypass = np.where(
             grid_imported_bypass <= effective_import_cap + 1e-9,
@@ -304,7 +328,13 @@ def _pwl_eval_array(
     values. Between breakpoints this is exact (the representation IS
     piecewise linear); below the first breakpoint the first segment's
     gradient is extrapolated -- see `_pwl_best_action_at_continuous_state`'s
-    #336 note."""
+    #336 note.
+
+    `np.interp` locates segments by binary search seeded with the previous
+    query's segment, so it is fastest when consecutive queries are close --
+    order a batch that way (see `_pwl_candidate_values_at`). Measured
+    against a single `np.searchsorted` pass with the same segment
+    arithmetic, which is bit-identical but 30-40% slower per window."""
     xs, vs = V_row
     result = np.interp(soe, xs, vs)
     if len(xs) > 1:
@@ -678,6 +708,99 @@ def run_pwl_window_backward_induction(
     splicing one in as if exact is the silent degradation this whole path
     exists to remove.
     """
+    return _pwl_backward_induction(
+        _pinned_terminal_row(
+            end_soe_target,
+            _end_soe_pin_tolerance(
+                end_soe_tolerance, battery_settings, dt, capabilities
+            ),
+            battery_settings,
+        ),
+        window_horizon,
+        buy_price,
+        sell_price,
+        home_consumption,
+        solar_production,
+        battery_settings,
+        dt,
+        max_charge_power_per_period,
+        capabilities,
+        import_cap_kwh,
+    )
+
+
+def _terminal_value_row(
+    terminal_value_per_kwh: float, battery_settings: BatterySettings
+) -> tuple[np.ndarray, np.ndarray]:
+    """Terminal PWL row valuing the usable energy left at the end of the
+    horizon at `terminal_value_per_kwh` -- the grid DP's `V[horizon]`
+    (`_run_dynamic_programming`), which is linear in SOE and so exactly two
+    breakpoints. Unlike `_pinned_terminal_row` it leaves the end SOE free."""
+    min_soe = battery_settings.min_soe_kwh
+    max_soe = battery_settings.max_soe_kwh
+    return (
+        np.array([min_soe, max_soe]),
+        np.array([0.0, terminal_value_per_kwh * (max_soe - min_soe)]),
+    )
+
+
+def run_pwl_backward_induction(
+    horizon: int,
+    buy_price: list[float],
+    sell_price: list[float],
+    home_consumption: list[float],
+    solar_production: list[float],
+    battery_settings: BatterySettings,
+    dt: float,
+    terminal_value_per_kwh: float = 0.0,
+    max_charge_power_per_period: list[float] | None = None,
+    capabilities: PlatformCapabilities = DEFAULT_CAPABILITIES,
+    import_cap_kwh: float | None = None,
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Exact PWL backward induction over a whole horizon, ending in the same
+    terminal value the grid DP uses (`_terminal_value_row`) instead of a
+    pinned SOE -- the backward pass of `optimize_battery_schedule`'s
+    `solver="pwl"` mode.
+
+    Returns `horizon + 1` PWL rows, replayed forward by `resolve_pwl_window`
+    from the initial SOE. Every row is refined and certified exactly as a
+    window's is, and an exhausted accuracy budget raises
+    `PWLWindowUnderRefinedError` the same way. Unlike a window, a whole
+    horizon has no pin to bisect at, so that error ends the solve. Without
+    the pin's ~1e6 SEK/kWh gradient the rows stay far smaller than a
+    window's: measured at 1-7k breakpoints on 24-60 period fixtures.
+    """
+    return _pwl_backward_induction(
+        _terminal_value_row(terminal_value_per_kwh, battery_settings),
+        horizon,
+        buy_price,
+        sell_price,
+        home_consumption,
+        solar_production,
+        battery_settings,
+        dt,
+        max_charge_power_per_period,
+        capabilities,
+        import_cap_kwh,
+    )
+
+
+def _pwl_backward_induction(
+    terminal_row: tuple[np.ndarray, np.ndarray],
+    horizon: int,
+    buy_price: list[float],
+    sell_price: list[float],
+    home_consumption: list[float],
+    solar_production: list[float],
+    battery_settings: BatterySettings,
+    dt: float,
+    max_charge_power_per_period: list[float] | None,
+    capabilities: PlatformCapabilities,
+    import_cap_kwh: float | None,
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Backward induction from `terminal_row` shared by the pinned window
+    solve and the whole-horizon solve; see
+    `run_pwl_window_backward_induction` for the refinement and its budgets."""
     horizon_inputs = (buy_price, sell_price, home_consumption, solar_production)
     power_row = np.concatenate(
         (
@@ -690,14 +813,10 @@ def run_pwl_window_backward_induction(
         )
     )
 
-    V: list[tuple[np.ndarray, np.ndarray]] = [None] * (window_horizon + 1)  # type: ignore[list-item]
-    V[window_horizon] = _pinned_terminal_row(
-        end_soe_target,
-        _end_soe_pin_tolerance(end_soe_tolerance, battery_settings, dt, capabilities),
-        battery_settings,
-    )
+    V: list[tuple[np.ndarray, np.ndarray]] = [None] * (horizon + 1)  # type: ignore[list-item]
+    V[horizon] = terminal_row
 
-    for t in range(window_horizon - 1, -1, -1):
+    for t in range(horizon - 1, -1, -1):
         xs_next, _vs_next = V[t + 1]
         period_max_charge = (
             max_charge_power_per_period[t]
@@ -754,8 +873,7 @@ def run_pwl_window_backward_induction(
             if not bad.any():
                 converged = True
                 break
-            X = np.sort(np.concatenate((X, probes[bad])))
-            X = X[np.concatenate(([True], np.diff(X) > _PWL_MERGE_EPS_KWH))]
+            X, V_t = _merge_breakpoints(X, V_t, probes[bad], probe_values[bad])
             # Prune inside the loop, not just at the end: every probe round
             # costs O(|X| x |actions|), so letting X accumulate tens of
             # thousands of provably-redundant points makes the row an order
@@ -763,7 +881,7 @@ def run_pwl_window_backward_induction(
             # with refinement because a point is only dropped when its error
             # is <= PWL_EPS_PRUNE, while re-adding it requires an error
             # above PWL_EPS_REFINE * (1 + |V|) >= PWL_EPS_PRUNE.
-            X, V_t = _pwl_prune(X, values_at(X), eps=PWL_EPS_PRUNE)
+            X, V_t = _pwl_prune(X, V_t, eps=PWL_EPS_PRUNE)
             if len(X) > PWL_MAX_BREAKPOINTS:
                 raise PWLWindowUnderRefinedError(
                     f"PWL window t={t}: breakpoint ceiling hit ({len(X)} > "
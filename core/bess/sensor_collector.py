@@ -4,7 +4,8 @@ Robust SensorCollector - Clean sensor data collection from InfluxDB with strateg
 
 import logging
 from datetime import timedelta
-from typing import ClassVar
+
+import requests
 
 from . import time_utils
 from .energy_flow_calculator import EnergyFlowCalculator
@@ -683,48 +684,28 @@ class SensorCollector:
     def _get_period_readings_from_live_sensors(self) -> dict[str, float] | None:
         """Get current sensor readings from live HA API.
 
+        All cumulative sensors come from one controller snapshot, so the
+        counters are read at the same instant rather than one request apart.
+
         Returns:
             Dictionary of sensor readings (cumulative values), or None if unavailable
         """
-        readings = {}
-
-        # Map sensor keys to ha_controller methods (only core sensors)
-        sensor_method_map = {
-            "lifetime_battery_charged": "get_battery_charged_lifetime",
-            "lifetime_battery_discharged": "get_battery_discharged_lifetime",
-            "lifetime_solar_energy": "get_solar_production_lifetime",
-            "lifetime_import_from_grid": "get_grid_import_lifetime",
-            "lifetime_export_to_grid": "get_grid_export_lifetime",
-            "battery_soc": "get_battery_soc",
-        }
+        try:
+            snapshot = self.ha_controller.snapshot(self.cumulative_sensor_keys)
+        except requests.RequestException as e:
+            logger.error("Failed to read live sensors: %s", e)
+            return None
 
+        readings = {}
         for sensor_key in self.cumulative_sensor_keys:
-            method_name = sensor_method_map.get(sensor_key)
-            if not method_name:
-                logger.debug(f"No HA method mapped for sensor key: {sensor_key}")
-                continue
-
-            try:
-                # Get the method from ha_controller
-                method = getattr(self.ha_controller, method_name, None)
-                if method is None:
-                    logger.debug(f"Method {method_name} not found on ha_controller")
-                    continue
-
-                # Call the method to get current value
-                value = method()
-                if value is not None:
-                    # Get entity ID for this sensor key
-                    entity_id = self.ha_controller.resolve_sensor_for_influxdb(
-                        sensor_key
-                    )
-                    if entity_id:
-                        readings[entity_id] = float(value)
-                        logger.debug(f"Live sensor {sensor_key} = {value}")
-
-            except Exception as e:
-                logger.warning(f"Failed to read live sensor {sensor_key}: {e}")
+            value = snapshot.value(sensor_key)
+            if value is None:
+                logger.warning(f"Live sensor {sensor_key} has no numeric value")
                 continue
+            entity_id = self.ha_controller.resolve_sensor_for_influxdb(sensor_key)
+            if entity_id:
+                readings[entity_id] = value
+                logger.debug(f"Live sensor {sensor_key} = {value}")
 
         if not readings:
             logger.error("No live sensor readings available")
@@ -733,49 +714,32 @@ class SensorCollector:
         logger.debug(f"Read {len(readings)} live sensors from HA API")
         return self._normalize_sensor_readings(readings)
 
-    # Power sensor key -> direct live-reading getter on ha_controller. Reading
-    # each sensor individually (kilobyte-sized single-entity requests) is far
-    # cheaper at this once-a-minute cadence than the full-instance
-    # `_fetch_all_states()` dump (potentially megabytes, every entity in the
-    # HA instance) used elsewhere for one-off entity discovery (#387 final
-    # review).
-    _POWER_SENSOR_GETTERS: ClassVar[dict[str, str]] = {
-        "pv_power": "get_pv_power",
-        "local_load_power": "get_local_load_power",
-        "import_power": "get_import_power",
-        "export_power": "get_export_power",
-        "battery_charge_power": "get_battery_charge_power",
-        "battery_discharge_power": "get_battery_discharge_power",
-    }
-
     def sample_live_power(self) -> None:
         """Record one live power-sensor sample into the rolling buffer.
 
         Called every minute by the scheduler. No-ops if no power sensors are
-        configured. A missing/invalid individual entity is skipped without
-        raising - the buffer just records whichever sensors succeeded this
-        poll.
+        configured. All power sensors come from one controller snapshot; a
+        missing/invalid individual entity is skipped without raising - the
+        buffer just records whichever sensors had a value this poll.
         """
         if not self.power_sensors:
             return
 
+        try:
+            snapshot = self.ha_controller.snapshot(list(self.power_sensor_flow_map))
+        except requests.RequestException as e:
+            logger.debug("Skipping power sample: %s", e)
+            return
+
         readings: dict[str, float] = {}
         for sensor_key, flow_name in self.power_sensor_flow_map.items():
-            getter_name = self._POWER_SENSOR_GETTERS.get(sensor_key)
-            if not getter_name:
-                continue
             try:
-                getter = getattr(self.ha_controller, getter_name)
-                value = getter()
-                if value is None:
-                    continue
-                readings[flow_name] = float(value)
-            except Exception as e:
-                logger.debug(
-                    "Skipping power sample for %s: %s",
-                    sensor_key,
-                    e,
-                )
+                value = self.ha_controller.power_from_snapshot(snapshot, sensor_key)
+            except ValueError as e:
+                logger.debug("Skipping power sample for %s: %s", sensor_key, e)
+                continue
+            if value is not None:
+                readings[flow_name] = value
 
         if not readings:
             return
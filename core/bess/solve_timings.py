@@ -0,0 +1,192 @@
+"""Per-phase wall-clock timings of one `optimize_battery_schedule` call.
+
+A quarterly solve that overruns the scheduler's 30 s `misfire_grace_time`
+drops the next run, and the log says only how long the whole solve took.
+The phases have very different cost drivers -- the grid backward induction
+scales with horizon x grid size, a PWL window with how tied the prices are
+-- so knowing *which* one ran long is most of the diagnosis.
+
+Top-level phases, in solve order:
+
+- `backward_induction`: the grid DP's value function (`_run_dynamic_programming`);
+- `forward_selection`: the per-period loop through `action_selector.select_action`;
+- `tie_detection`: `tie_detection.detect_tie_windows`;
+- `pwl_resolution`: every PWL window re-solve, also itemised per window
+  together with any window a budgeted solve skipped (`pwl_budget`);
+- `replay_accounting`: `_replay_accounting_pass` over a spliced schedule.
+
+`tie_policy` (`apply_tie_policy`) is the one nested phase: it runs inside
+every `select_action` call, so its time is also part of `forward_selection`
+and `pwl_resolution`. It is reported because a pathological candidate set
+shows up there first, but it is never summed with the others.
+
+The phase being timed is several calls deep from the solve that owns the
+timings (`apply_tie_policy` runs under both the grid and the PWL forward
+replay), so the timings in progress are found through a context variable
+rather than threaded through every signature on the way. Recording outside
+a solve is a no-op, which keeps the selector usable on its own in tests.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .tie_detection import TIE_NOISE_FACTOR
+
+PHASE_BACKWARD_INDUCTION = "backward_induction"
+PHASE_FORWARD_SELECTION = "forward_selection"
+PHASE_TIE_DETECTION = "tie_detection"
+PHASE_PWL_RESOLUTION = "pwl_resolution"
+PHASE_REPLAY_ACCOUNTING = "replay_accounting"
+PHASE_TIE_POLICY = "tie_policy"
+
+WINDOW_RESOLVED = "resolved"
+WINDOW_BISECTED = "bisected"
+WINDOW_SKIPPED = "skipped"
+
+# Phases that partition the solve; see the module docstring for tie_policy.
+TOP_LEVEL_PHASES = (
+    PHASE_BACKWARD_INDUCTION,
+    PHASE_FORWARD_SELECTION,
+    PHASE_TIE_DETECTION,
+    PHASE_PWL_RESOLUTION,
+    PHASE_REPLAY_ACCOUNTING,
+)
+
+
+@dataclass
+class PWLWindowTiming:
+    """One PWL window solve attempt, by outcome: `resolved`; `bisected`, an
+    attempt that could not certify the window and was split (#624), whose
+    time was still spent; or `skipped`, a window the solve's PWL budget ran
+    out before (0 s). `noise_factor` is the detection threshold that
+    flagged the window."""
+
+    start: int
+    end: int
+    seconds: float
+    outcome: str = WINDOW_RESOLVED
+    noise_factor: float = TIE_NOISE_FACTOR
+
+
+@dataclass
+class SolveTimings:
+    """Wall-clock seconds per phase of one solve, plus the solve's total."""
+
+    phases: dict[str, float] = field(default_factory=dict)
+    pwl_windows: list[PWLWindowTiming] = field(default_factory=list)
+    total: float = 0.0
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def dominant_phase(self) -> str | None:
+        """The top-level phase that took longest, or None before any ran."""
+        recorded = [phase for phase in TOP_LEVEL_PHASES if phase in self.phases]
+        if not recorded:
+            return None
+        return max(recorded, key=lambda phase: self.phases[phase])
+
+    def describe(self) -> str:
+        """One log line: total, then each recorded phase, longest first."""
+        parts = sorted(self.phases.items(), key=lambda item: -item[1])
+        breakdown = ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in parts)
+        return f"{self.total:.2f}s ({breakdown})"
+
+
+_active: ContextVar[SolveTimings | None] = ContextVar("solve_timings", default=None)
+
+
+@contextmanager
+def recording(timings: SolveTimings) -> Iterator[SolveTimings]:
+    """Make `timings` the target of `record_phase` for the enclosed solve."""
+    token = _active.set(timings)
+    try:
+        yield timings
+    finally:
+        _active.reset(token)
+
+
+def record_phase(phase: str, started: float) -> None:
+    """Add the time since `started` (a `time.perf_counter()` reading) to
+    `phase` of the solve in progress."""
+    timings = _active.get()
+    if timings is not None:
+        timings.add(phase, time.perf_counter() - started)
+
+
+def record_pwl_window(
+    start: int,
+    end: int,
+    started: float,
+    outcome: str,
+    noise_factor: float = TIE_NOISE_FACTOR,
+) -> None:
+    """Record one PWL window attempt, itemised and in `pwl_resolution`."""
+    timings = _active.get()
+    if timings is not None:
+        seconds = time.perf_counter() - started
+        timings.pwl_windows.append(
+            PWLWindowTiming(start, end, seconds, outcome, noise_factor)
+        )
+        timings.add(PHASE_PWL_RESOLUTION, seconds)
+
+
+def record_skipped_pwl_window(start: int, end: int, noise_factor: float) -> None:
+    """Record a window the PWL budget left to the grid DP's schedule."""
+    timings = _active.get()
+    if timings is not None:
+        timings.pwl_windows.append(
+            PWLWindowTiming(start, end, 0.0, WINDOW_SKIPPED, noise_factor)
+        )
+
+
+def _distribution(samples: list[float]) -> dict[str, float]:
+    p50, p95 = np.percentile(samples, [50, 95])
+    return {"p50": float(p50), "p95": float(p95), "max": max(samples)}
+
+
+def summarize_solve_timings(solves: list[SolveTimings]) -> dict:
+    """p50/p95/max of the total and of every phase across `solves`.
+
+    A phase a solve never entered (no tie window, so no PWL resolution)
+    counts as 0 s for that solve: the distribution describes what a solve
+    costs, and most solves skip the PWL phases entirely.
+    """
+    if not solves:
+        return {"solves": 0}
+    phases = [*TOP_LEVEL_PHASES, PHASE_TIE_POLICY]
+    window_seconds = [
+        window.seconds
+        for solve in solves
+        for window in solve.pwl_windows
+        if window.outcome != WINDOW_SKIPPED
+    ]
+    skipped = sum(
+        1
+        for solve in solves
+        for window in solve.pwl_windows
+        if window.outcome == WINDOW_SKIPPED
+    )
+    slowest = max(solves, key=lambda solve: solve.total)
+    return {
+        "solves": len(solves),
+        "total": _distribution([solve.total for solve in solves]),
+        "phases": {
+            phase: _distribution([solve.phases.get(phase, 0.0) for solve in solves])
+            for phase in phases
+        },
+        "pwl_windows": {
+            "count": len(window_seconds),
+            "skipped": skipped,
+            **(_distribution(window_seconds) if window_seconds else {}),
+        },
+        "slowest": {
+            "total": slowest.total,
+            "dominant_phase": slowest.dominant_phase(),
+        },
+    }
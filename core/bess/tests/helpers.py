@@ -12,6 +12,7 @@ from core.bess.dp_battery_algorithm import (
     _period_flows,
     optimize_battery_schedule,
 )
+from core.bess.models import OptimizationResult
 from core.bess.price_manager import MockSource, PriceManager
 from core.bess.settings import (
     ADDITIONAL_COSTS,
@@ -164,6 +165,13 @@ def run_scenario_realized(scenario: dict) -> tuple:
     """
     inp = _scenario_inputs(scenario)
     result = optimize_battery_schedule(**inp)
+    return result, realized_cost(inp, result)
+
+
+def realized_cost(inp: dict, result: OptimizationResult) -> float:
+    """Execute an already-solved plan through the inverter simulator and
+    return its realized cost (R). `inp` is the `_scenario_inputs` the plan
+    was solved from."""
     dt = inp["period_duration_hours"]
     settings = inp["battery_settings"]
     commands = [
@@ -185,7 +193,7 @@ def run_scenario_realized(scenario: dict) -> tuple:
         settings,
         dt,
     )
-    return result, sim.realized_cost
+    return sim.realized_cost
 
 
 def get_intent_distribution(result) -> dict[str, int]:
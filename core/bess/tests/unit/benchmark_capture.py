@@ -0,0 +1,192 @@
+"""Shared measurement path for the fixture-corpus performance baseline.
+
+One definition of "solve this fixture and record how fast, how large and how
+good the result was", used by `scripts/bench_fixture_corpus.py` (which runs
+the corpus over a process pool, writes the baseline and gates against it)
+and `test_benchmark_capture.py` -- the same arrangement as
+`golden_capture.py` and `vpp_capture.py`.
+
+Per fixture it records:
+
+- solve latency, p50 and p95 over `repeats` timed `optimize_battery_schedule`
+  calls on the fixture's `_scenario_inputs`, exactly the call the scenario
+  suite and the goldens make;
+- peak traced memory of one further, untimed solve. tracemalloc sees numpy's
+  buffers, so this is the DP grid's footprint, not the interpreter's RSS --
+  and it is measured apart from the timed runs because tracing slows
+  allocation enough to distort them;
+- the number of #450 PWL re-solves (tie windows) the solve triggered, the
+  term that dominates latency on the fixtures that have any;
+- the realized cost of executing the plan through the inverter simulator.
+
+Cost is deterministic (to ~1e-13 across interpreters, see
+`test_action_selector_parity`), so it gates on any machine. Latency and
+memory are properties of the machine and the pool size, so the baseline
+records the environment it was measured in and `compare` only fails on
+latency against a baseline from the same environment; elsewhere latency
+drift is reported but does not fail.
+"""
+
+import json
+import logging
+import os
+import platform
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from core.bess.dp_battery_algorithm import optimize_battery_schedule
+from core.bess.tests.helpers import _scenario_inputs, realized_cost
+from core.bess.tests.unit.golden_capture import DATA_DIR
+
+BASELINE_PATH = DATA_DIR / "baselines" / "benchmark_baseline.json"
+
+
+@dataclass(frozen=True)
+class Regression:
+    """One metric of one fixture that moved past its threshold."""
+
+    fixture: str
+    metric: str
+    baseline: float | str
+    current: float | str
+    gating: bool = True
+
+    def __str__(self) -> str:
+        if isinstance(self.baseline, float) and isinstance(self.current, float):
+            return (
+                f"{self.fixture}: {self.metric} {self.baseline:.6g} -> "
+                f"{self.current:.6g}"
+            )
+        return f"{self.fixture}: {self.metric} {self.baseline} -> {self.current}"
+
+
+def environment(workers: int, repeats: int) -> dict:
+    """What a latency figure is only comparable within. Two runs that differ
+    in any of these measure different things, not a regression."""
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "workers": workers,
+        "repeats": repeats,
+    }
+
+
+def measure_fixture(name: str, repeats: int) -> dict:
+    """Solve one fixture `repeats` times (plus one traced run) and return its
+    metrics. Never raises: a failing solve is recorded as `status: error`,
+    since a raise is a finding the caller reports, not a reason to lose the
+    rest of the corpus."""
+    scenario = json.loads((DATA_DIR / f"{name}.json").read_text())
+    try:
+        inputs = _scenario_inputs(scenario)
+        samples = []
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            optimize_battery_schedule(**inputs)
+            samples.append(time.perf_counter() - t0)
+
+        diagnostics: dict = {}
+        tracemalloc.start()
+        try:
+            result = optimize_battery_schedule(**inputs, tie_diagnostics=diagnostics)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except Exception as exc:
+        return {"status": "error", "error": f"{type(exc).__name__}: {exc}"}
+    if result.economic_summary is None:
+        return {"status": "error", "error": "solve returned no economic summary"}
+
+    p50, p95 = np.percentile(samples, [50, 95])
+    return {
+        "status": "ok",
+        "periods": len(inputs["buy_price"]),
+        "latency_p50_s": float(p50),
+        "latency_p95_s": float(p95),
+        "peak_memory_mb": peak / 2**20,
+        "pwl_resolves": len(diagnostics["windows"]),
+        "planned_cost": result.economic_summary.battery_solar_cost,
+        "realized_cost": realized_cost(inputs, result),
+    }
+
+
+def _quiet_worker() -> None:
+    # The optimizer logs at INFO on every solve; across a pool that is
+    # thousands of interleaved lines. Failures are in the returned metrics.
+    logging.disable(logging.CRITICAL)
+
+
+def measure_corpus(names: list[str], repeats: int, workers: int) -> dict[str, dict]:
+    """`measure_fixture` for every name, fanned out over `workers` processes.
+
+    Each fixture is timed inside a single worker, so its latency is a
+    single-process figure; `workers` only changes how many solves contend
+    for the machine at once, which is why it is part of `environment`.
+    """
+    with ProcessPoolExecutor(max_workers=workers, initializer=_quiet_worker) as pool:
+        measured = pool.map(measure_fixture, names, [repeats] * len(names))
+        return dict(zip(names, measured, strict=True))
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    latency_tolerance: float,
+    latency_floor_s: float,
+    cost_tolerance: float,
+) -> list[Regression]:
+    """Every metric of `current` that regressed against `baseline`.
+
+    Latency regresses when p50 exceeds the baseline by both the relative
+    `latency_tolerance` and the absolute `latency_floor_s` -- the floor keeps
+    scheduler jitter on a 20 ms fixture from reading as a 30% slowdown. Its
+    regressions only gate when both runs share an `environment`. Realized
+    cost regresses when it rises by more than `cost_tolerance`; a cheaper
+    plan is an improvement, not drift, and is left to the goldens to pin.
+
+    Fixtures present on one side only are not regressions: the corpus grows,
+    and a new fixture has nothing to regress from.
+    """
+    same_environment = baseline["environment"] == current["environment"]
+    regressions = []
+    for name, recorded in sorted(baseline["fixtures"].items()):
+        measured = current["fixtures"].get(name)
+        if measured is None or recorded["status"] != "ok":
+            continue
+        if measured["status"] != "ok":
+            regressions.append(
+                Regression(name, "status", recorded["status"], measured["error"])
+            )
+            continue
+
+        latency_limit = max(
+            recorded["latency_p50_s"] * (1 + latency_tolerance),
+            recorded["latency_p50_s"] + latency_floor_s,
+        )
+        if measured["latency_p50_s"] > latency_limit:
+            regressions.append(
+                Regression(
+                    name,
+                    "latency_p50_s",
+                    recorded["latency_p50_s"],
+                    measured["latency_p50_s"],
+                    gating=same_environment,
+                )
+            )
+        if measured["realized_cost"] > recorded["realized_cost"] + cost_tolerance:
+            regressions.append(
+                Regression(
+                    name,
+                    "realized_cost",
+                    recorded["realized_cost"],
+                    measured["realized_cost"],
+                )
+            )
+    return regressions
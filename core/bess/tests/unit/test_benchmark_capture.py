@@ -0,0 +1,97 @@
+"""The corpus benchmark's regression gate, and its measurement of one fixture.
+
+`compare` decides whether `scripts/bench_fixture_corpus.py` exits non-zero,
+so its thresholds are pinned here on hand-built runs rather than trusted to
+whatever the corpus happens to do on the day.
+"""
+
+import json
+
+import pytest
+
+from core.bess.tests.helpers import run_scenario_realized
+from core.bess.tests.unit.benchmark_capture import (
+    DATA_DIR,
+    compare,
+    environment,
+    measure_fixture,
+)
+
+
+def _run(latency=1.0, cost=10.0, status="ok", env=None):
+    fixture = (
+        {"status": "ok", "latency_p50_s": latency, "realized_cost": cost}
+        if status == "ok"
+        else {"status": "error", "error": "ValueError: boom"}
+    )
+    return {
+        "environment": env or environment(workers=2, repeats=5),
+        "fixtures": {"day": fixture},
+    }
+
+
+def _compare(baseline, current):
+    return compare(
+        baseline,
+        current,
+        latency_tolerance=0.25,
+        latency_floor_s=0.05,
+        cost_tolerance=1e-6,
+    )
+
+
+def test_unchanged_run_has_no_regressions():
+    assert _compare(_run(), _run()) == []
+
+
+def test_latency_past_the_tolerance_regresses():
+    (regression,) = _compare(_run(latency=1.0), _run(latency=1.3))
+
+    assert (regression.metric, regression.gating) == ("latency_p50_s", True)
+
+
+def test_latency_rise_under_the_absolute_floor_is_jitter():
+    assert _compare(_run(latency=0.02), _run(latency=0.06)) == []
+
+
+def test_latency_from_another_environment_is_reported_but_not_gating():
+    other = environment(workers=8, repeats=5)
+
+    (regression,) = _compare(_run(latency=1.0), _run(latency=2.0, env=other))
+
+    assert not regression.gating
+
+
+def test_costlier_plan_regresses_and_cheaper_does_not():
+    assert [r.metric for r in _compare(_run(cost=10.0), _run(cost=10.01))] == [
+        "realized_cost"
+    ]
+    assert _compare(_run(cost=10.0), _run(cost=9.5)) == []
+
+
+def test_fixture_that_starts_failing_regresses():
+    (regression,) = _compare(_run(), _run(status="error"))
+
+    assert regression.metric == "status"
+
+
+def test_new_fixture_is_not_a_regression():
+    current = _run()
+    current["fixtures"]["new_day"] = current["fixtures"]["day"]
+
+    assert _compare(_run(), current) == []
+
+
+@pytest.mark.slow
+def test_measured_cost_is_the_realized_cost_of_the_scenario():
+    name = "historical_2025_01_05_no_spread_no_solar"
+    scenario = json.loads((DATA_DIR / f"{name}.json").read_text())
+    result, realized = run_scenario_realized(scenario)
+
+    measured = measure_fixture(name, repeats=2)
+
+    assert measured["status"] == "ok"
+    assert measured["realized_cost"] == realized
+    assert measured["planned_cost"] == result.economic_summary.battery_solar_cost
+    assert measured["latency_p50_s"] <= measured["latency_p95_s"]
+    assert measured["peak_memory_mb"] > 0
@@ -19,6 +19,8 @@ from core.bess.models import (
     PeriodData,
 )
 from core.bess.price_manager import MockSource
+from core.bess.schedule_store import ScheduleStore
+from core.bess.solve_timings import SolveTimings
 from core.bess.time_utils import TIMEZONE
 
 _DEFAULT_OPTIONS = {"inverter": {"platform": "growatt_server_min"}}
@@ -465,6 +467,32 @@ class TestRuntimeFailureTracking:
         assert "00:30" in failures[0].operation
 
 
+class TestGetSolvePerformance:
+    def test_no_solves_today(self, system):
+        summary = system.get_solve_performance()
+        assert summary["solves"] == 0
+        assert summary["latest"] is None
+
+    def test_summarizes_todays_solves_and_skips_untimed_ones(self, system, tmp_path):
+        system.schedule_store = ScheduleStore(persist_path=tmp_path / "intents.json")
+        for total in (4.0, 40.0):
+            result = _make_minimal_optimization_result(1)
+            result.timings = SolveTimings(
+                phases={"backward_induction": total - 1.0}, total=total
+            )
+            system.schedule_store.store_schedule(result, optimization_period=0)
+        system.schedule_store.store_schedule(
+            _make_minimal_optimization_result(1), optimization_period=0
+        )
+
+        summary = system.get_solve_performance()
+
+        assert summary["solves"] == 2
+        assert summary["total"]["max"] == 40.0
+        assert summary["slowest"]["dominant_phase"] == "backward_induction"
+        assert summary["latest"]["total"] == 40.0
+
+
 class TestCriticalSensorFailures:
     def test_no_failures_initially(self, system):
         assert not system.has_critical_sensor_failures()
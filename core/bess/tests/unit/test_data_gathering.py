@@ -0,0 +1,179 @@
+"""The concurrent data-gathering stage in front of each quarterly solve.
+
+Slow sources are simulated with a threading.Event the fetch blocks on, so
+no test depends on how fast the machine is beyond the short deadlines.
+"""
+
+import threading
+
+import pytest
+
+from core.bess.data_gathering import (
+    CACHED,
+    FAILED,
+    FETCHED,
+    DataGatheringStage,
+    DataSource,
+)
+from core.bess.exceptions import DataSourceTimeoutError
+
+
+@pytest.fixture
+def release():
+    event = threading.Event()
+    yield event
+    event.set()  # let any abandoned fetch finish
+
+
+def _blocking(release: threading.Event, value):
+    def fetch():
+        release.wait(5)
+        return value
+
+    return fetch
+
+
+def test_sources_are_fetched_concurrently():
+    stage = DataGatheringStage()
+    barrier = threading.Barrier(3, timeout=2)
+
+    def fetch(value):
+        def run():
+            barrier.wait()  # only passes when all three run at once
+            return value
+
+        return run
+
+    gathered = stage.gather(
+        [DataSource(name, fetch(name), deadline=2.0) for name in ("a", "b", "c")]
+    )
+
+    assert [gathered.get(name) for name in ("a", "b", "c")] == ["a", "b", "c"]
+    assert {t.outcome for t in gathered.timings.values()} == {FETCHED}
+
+
+def test_missed_deadline_falls_back_to_the_last_value(release):
+    stage = DataGatheringStage()
+    stage.gather([DataSource("prices", lambda: [1.0], 1.0, cache_key="today")])
+
+    gathered = stage.gather(
+        [DataSource("prices", _blocking(release, [2.0]), 0.05, cache_key="today")]
+    )
+
+    assert gathered.get("prices") == [1.0]
+    assert gathered.timings["prices"].outcome == CACHED
+
+
+def test_last_value_from_another_cache_key_is_not_reused(release):
+    stage = DataGatheringStage()
+    stage.gather([DataSource("prices", lambda: [1.0], 1.0, cache_key="yesterday")])
+
+    gathered = stage.gather(
+        [DataSource("prices", _blocking(release, [2.0]), 0.05, cache_key="today")]
+    )
+
+    assert gathered.timings["prices"].outcome == FAILED
+    with pytest.raises(DataSourceTimeoutError):
+        gathered.get("prices")
+
+
+def test_failing_fetch_falls_back_or_reraises():
+    stage = DataGatheringStage()
+
+    def boom():
+        raise RuntimeError("weather API down")
+
+    first = stage.gather([DataSource("temperature", boom, 1.0)])
+    with pytest.raises(RuntimeError, match="weather API down"):
+        first.get("temperature")
+
+    stage.gather([DataSource("temperature", lambda: [5.0], 1.0)])
+    again = stage.gather([DataSource("temperature", boom, 1.0)])
+    assert again.get("temperature") == [5.0]
+
+
+def test_source_still_fetching_is_not_submitted_again(release):
+    stage = DataGatheringStage()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait(5)
+        return "late"
+
+    stage.gather([DataSource("solar", slow, 0.05)])
+    stage.gather([DataSource("solar", slow, 0.05)])
+
+    assert len(calls) == 1
+
+
+def test_abandoned_fetch_becomes_the_next_fallback(release):
+    stage = DataGatheringStage()
+
+    stage.gather([DataSource("solar", _blocking(release, "late"), 0.05)])
+    release.set()
+    stage._in_flight["solar"].result(timeout=5)
+
+    def hang():
+        threading.Event().wait(0.5)
+        return "never used"
+
+    gathered = stage.gather([DataSource("solar", hang, 0.05)])
+
+    assert gathered.get("solar") == "late"
+
+
+def test_source_without_deadline_is_waited_for():
+    stage = DataGatheringStage()
+
+    def slow():
+        threading.Event().wait(0.2)
+        return "done"
+
+    gathered = stage.gather([DataSource("energy_data", slow, deadline=None)])
+
+    assert gathered.get("energy_data") == "done"
+    assert gathered.timings["energy_data"].seconds >= 0.2
+
+
+def test_manager_serves_a_slow_solar_forecast_from_its_last_value(monkeypatch, release):
+    from core.bess import battery_system_manager
+    from core.bess.battery_system_manager import BatterySystemManager
+    from core.bess.price_manager import MockSource
+    from core.bess.tests.conftest import MockHomeAssistantController
+
+    controller = MockHomeAssistantController()
+    controller.solar_forecast = [1.0] * 96
+    system = BatterySystemManager(
+        controller=controller,
+        price_source=MockSource([0.5] * 96),
+        addon_options={"inverter": {"platform": "growatt_server_min"}},
+    )
+    system._gather_inputs(period=10, is_first_run=True, prepare_next_day=False)
+
+    monkeypatch.setitem(battery_system_manager.GATHER_DEADLINES_SECONDS, "solar", 0.05)
+    monkeypatch.setattr(
+        controller, "get_solar_forecast", _blocking(release, [9.0] * 96)
+    )
+    gathered = system._gather_inputs(
+        period=11, is_first_run=False, prepare_next_day=False
+    )
+
+    assert gathered.get("solar") == [1.0] * 96
+    assert set(gathered.get("prices")[0]) == {0.5}
+    sources = system.get_solve_performance()["data_gathering"]["sources"]
+    assert sources["solar"]["outcome"] == CACHED
+    assert sources["prices"]["outcome"] == FETCHED
+
+
+def test_source_without_fallback_reraises_even_with_a_last_value():
+    stage = DataGatheringStage()
+    stage.gather([DataSource("energy_data", lambda: None, None, fallback=False)])
+
+    def boom():
+        raise RuntimeError("sensor read failed")
+
+    gathered = stage.gather([DataSource("energy_data", boom, None, fallback=False)])
+
+    with pytest.raises(RuntimeError, match="sensor read failed"):
+        gathered.get("energy_data")
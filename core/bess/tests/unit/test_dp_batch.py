@@ -0,0 +1,138 @@
+"""A batched ensemble solve must reproduce the single-scenario solves exactly.
+
+Every comparison is `np.array_equal`, not a tolerance: the batch only adds a
+leading axis to the same per-cell arithmetic, so any drift means a primitive
+broadcast the scenario axis into something it should not have touched.
+"""
+
+import numpy as np
+import pytest
+
+from core.bess.dp_batch import (
+    ForecastScenario,
+    batched_value_functions,
+    optimize_battery_schedules,
+)
+from core.bess.dp_battery_algorithm import (
+    _run_dynamic_programming,
+    optimize_battery_schedule,
+)
+from core.bess.tests.helpers import make_battery_settings
+
+DT = 0.25
+HORIZON = 24
+
+
+def _ensemble():
+    buy = [0.5 + ((t * 5) % 7) * 0.3 for t in range(HORIZON)]
+    solar = [max(0.0, 1.6 - abs(t - 12) * 0.15) for t in range(HORIZON)]
+    home = [0.2 + 0.9 * (t % 3) for t in range(HORIZON)]
+    return [
+        ForecastScenario(
+            buy_price=buy,
+            sell_price=[p - 0.6 for p in buy],
+            home_consumption=[h * load for h in home],
+            solar_production=[s * solar_scale for s in solar],
+            initial_soe=6.0,
+            terminal_value_per_kwh=terminal,
+        )
+        for solar_scale, load, terminal in [
+            (1.0, 1.0, 0.7),
+            (0.0, 1.0, 0.0),
+            (2.5, 0.6, 0.7),
+            (1.3, 1.4, 0.3),
+        ]
+    ]
+
+
+def _single(scenario, settings, **kwargs):
+    return _run_dynamic_programming(
+        horizon=len(scenario.buy_price),
+        buy_price=scenario.buy_price,
+        sell_price=scenario.sell_price,
+        home_consumption=scenario.home_consumption,
+        solar_production=scenario.solar_production,
+        battery_settings=settings,
+        dt=DT,
+        terminal_value_per_kwh=scenario.terminal_value_per_kwh,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize(
+    "bounds",
+    [
+        {},
+        {
+            "max_charge_power_per_period": [
+                10.0 - (t % 4) * 2.5 for t in range(HORIZON)
+            ],
+            "import_cap_kwh": 0.9,
+        },
+    ],
+)
+def test_batched_value_functions_match_single_solves(bounds):
+    """Includes an AC-output cap, so the per-scenario discharge headroom
+    differs across the batch within one period."""
+    settings = make_battery_settings(inverter_max_ac_power_kw=6.0)
+    scenarios = _ensemble()
+
+    batched = batched_value_functions(scenarios, settings, DT, **bounds)
+
+    for k, scenario in enumerate(scenarios):
+        assert np.array_equal(batched[k], _single(scenario, settings, **bounds))
+
+
+def test_scenarios_of_unequal_length_are_rejected():
+    scenarios = _ensemble()
+    short = scenarios[1]
+    scenarios[1] = ForecastScenario(
+        buy_price=short.buy_price[:-1],
+        sell_price=short.sell_price[:-1],
+        home_consumption=short.home_consumption[:-1],
+        solar_production=short.solar_production[:-1],
+    )
+
+    with pytest.raises(ValueError, match="Scenario 1"):
+        batched_value_functions(scenarios, make_battery_settings(), DT)
+
+
+def test_value_function_of_the_wrong_shape_is_rejected():
+    scenario = _ensemble()[0]
+
+    with pytest.raises(ValueError, match="value_function has shape"):
+        optimize_battery_schedule(
+            buy_price=scenario.buy_price,
+            sell_price=scenario.sell_price,
+            home_consumption=scenario.home_consumption,
+            solar_production=scenario.solar_production,
+            battery_settings=make_battery_settings(),
+            value_function=np.zeros((HORIZON, 3)),
+        )
+
+
+@pytest.mark.slow
+def test_batched_schedules_match_single_solves():
+    settings = make_battery_settings()
+    scenarios = _ensemble()
+
+    batched = optimize_battery_schedules(scenarios, settings, period_duration_hours=DT)
+
+    for scenario, result in zip(scenarios, batched, strict=True):
+        single = optimize_battery_schedule(
+            buy_price=scenario.buy_price,
+            sell_price=scenario.sell_price,
+            home_consumption=scenario.home_consumption,
+            solar_production=scenario.solar_production,
+            battery_settings=settings,
+            initial_soe=scenario.initial_soe,
+            period_duration_hours=DT,
+            terminal_value_per_kwh=scenario.terminal_value_per_kwh,
+        )
+        assert [p.decision.battery_action for p in result.period_data] == [
+            p.decision.battery_action for p in single.period_data
+        ]
+        assert (
+            result.economic_summary.battery_solar_cost
+            == single.economic_summary.battery_solar_cost
+        )
@@ -0,0 +1,152 @@
+"""Warm-started backward induction must reproduce the cold solve exactly.
+
+The cache in `dp_value_cache.py` only ever hands back rows it proves would be
+recomputed identically, so every test here compares against a cold
+`_run_dynamic_programming` with `np.array_equal`, not a tolerance: a warm
+start that moved V by one ulp could move a tie-break, and with it a plan.
+"""
+
+import numpy as np
+import pytest
+
+from core.bess.dp_battery_algorithm import (
+    _run_dynamic_programming,
+    optimize_battery_schedule,
+)
+from core.bess.dp_value_cache import DPValueCache
+from core.bess.tests.helpers import make_battery_settings
+
+DT = 0.25
+HORIZON = 48
+
+
+def _day():
+    buy = [0.6 + 0.9 * ((t * 7) % 13) / 13 for t in range(HORIZON)]
+    return {
+        "buy_price": buy,
+        "sell_price": [p * 0.6 for p in buy],
+        "home_consumption": [0.3 + 0.05 * (t % 5) for t in range(HORIZON)],
+        "solar_production": [
+            max(0.0, 1.2 - abs(t - 24) * 0.08) for t in range(HORIZON)
+        ],
+    }
+
+
+def _solve(day, settings, cache=None, **kwargs):
+    return _run_dynamic_programming(
+        horizon=len(day["buy_price"]),
+        buy_price=day["buy_price"],
+        sell_price=day["sell_price"],
+        home_consumption=day["home_consumption"],
+        solar_production=day["solar_production"],
+        battery_settings=settings,
+        dt=DT,
+        terminal_value_per_kwh=0.8,
+        value_cache=cache,
+        **kwargs,
+    )
+
+
+def _sliced(day, start):
+    return {key: values[start:] for key, values in day.items()}
+
+
+def test_refreshed_near_term_forecast_matches_cold_solve():
+    settings = make_battery_settings()
+    cache = DPValueCache()
+    day = _day()
+    _solve(day, settings, cache)
+
+    day["home_consumption"][3] += 0.4
+    day["solar_production"][5] = 0.0
+
+    assert np.array_equal(_solve(day, settings, cache), _solve(day, settings))
+
+
+def test_next_quarter_resolve_matches_cold_solve():
+    settings = make_battery_settings()
+    cache = DPValueCache()
+    day = _day()
+    _solve(day, settings, cache)
+
+    later = _sliced(day, 1)
+    later["home_consumption"][0] = 1.1
+
+    assert np.array_equal(_solve(later, settings, cache), _solve(later, settings))
+
+
+def test_changed_tail_is_recomputed():
+    settings = make_battery_settings()
+    cache = DPValueCache()
+    day = _day()
+    _solve(day, settings, cache)
+
+    day["buy_price"][-1] = 5.0
+
+    assert np.array_equal(_solve(day, settings, cache), _solve(day, settings))
+
+
+def test_settings_edited_in_place_invalidate_the_cache():
+    """`update_settings` mutates BatterySettings in place; a cache that held
+    the object rather than a snapshot would compare equal and reuse V rows
+    computed for the old battery."""
+    settings = make_battery_settings()
+    cache = DPValueCache()
+    day = _day()
+    _solve(day, settings, cache)
+
+    settings.update(cycle_cost_per_kwh=0.1)
+
+    assert np.array_equal(_solve(day, settings, cache), _solve(day, settings))
+
+
+def test_derating_limits_are_part_of_the_period_key():
+    settings = make_battery_settings()
+    cache = DPValueCache()
+    day = _day()
+    limits = [10.0] * HORIZON
+    _solve(day, settings, cache, max_charge_power_per_period=limits)
+
+    limits = [*limits[:-4], 2.0, 2.0, 2.0, 2.0]
+
+    assert np.array_equal(
+        _solve(day, settings, cache, max_charge_power_per_period=limits),
+        _solve(day, settings, max_charge_power_per_period=limits),
+    )
+
+
+@pytest.mark.slow
+def test_warm_started_schedule_is_unchanged():
+    settings = make_battery_settings()
+    cache = DPValueCache()
+    day = _day()
+    optimize_battery_schedule(
+        **day,
+        battery_settings=settings,
+        initial_soe=8.0,
+        terminal_value_per_kwh=0.8,
+        value_cache=cache,
+    )
+    later = _sliced(day, 2)
+
+    warm = optimize_battery_schedule(
+        **later,
+        battery_settings=settings,
+        initial_soe=9.0,
+        terminal_value_per_kwh=0.8,
+        value_cache=cache,
+    )
+    cold = optimize_battery_schedule(
+        **later,
+        battery_settings=settings,
+        initial_soe=9.0,
+        terminal_value_per_kwh=0.8,
+    )
+
+    assert [p.decision.battery_action for p in warm.period_data] == [
+        p.decision.battery_action for p in cold.period_data
+    ]
+    assert (
+        warm.economic_summary.battery_solar_cost
+        == cold.economic_summary.battery_solar_cost
+    )
@@ -5,6 +5,7 @@ exercising the real _api_request / _service_call_with_retry / _get_raw_state
 code paths without needing a live Home Assistant instance.
 """
 
+import json
 import logging
 from unittest.mock import MagicMock, patch
 
@@ -1249,3 +1250,74 @@ class TestSensorsLiveView:
         store.data["sensors"] = {"battery_soc": "sensor.battery_soc_v2"}
 
         assert c.sensors == {"battery_soc": "sensor.battery_soc_v2"}
+
+
+# ── Bulk sensor snapshot ──────────────────────────────────────────────────────
+
+
+def _template_response(rendered: dict):
+    """A POST /api/template response: the rendered template as plain text."""
+    resp = _mock_response(content_type="text/plain; charset=utf-8")
+    resp.content = json.dumps(rendered).encode()
+    resp.text = json.dumps(rendered)
+    return resp
+
+
+class TestSnapshot:
+    def test_renders_every_sensor_in_one_template_call(self, ctrl):
+        ctrl.session.post = _session_method_mock(
+            "post",
+            return_value=_template_response(
+                {"sensor.battery_soc": "64", "sensor.charge_power": "unavailable"}
+            ),
+        )
+
+        snapshot = ctrl.snapshot(["battery_soc", "battery_charge_power", "nope"])
+
+        ctrl.session.post.assert_called_once()
+        template = ctrl.session.post.call_args.kwargs["json"]["template"]
+        assert "states('sensor.battery_soc') | to_json" in template
+        assert snapshot.value("battery_soc") == 64.0
+        assert snapshot.value("battery_charge_power") is None
+        assert snapshot.value("nope") is None
+
+    def test_shared_signed_entity_is_read_once_and_split(self, signed_grid_ctrl):
+        signed_grid_ctrl.session.post = _session_method_mock(
+            "post",
+            return_value=_template_response({"sensor.solis_grid_power_net": "-800"}),
+        )
+
+        snapshot = signed_grid_ctrl.snapshot(["import_power", "export_power"])
+
+        template = signed_grid_ctrl.session.post.call_args.kwargs["json"]["template"]
+        assert template.count("sensor.solis_grid_power_net") == 2  # key + states()
+        assert signed_grid_ctrl.power_from_snapshot(snapshot, "import_power") == 0.0
+        assert signed_grid_ctrl.power_from_snapshot(snapshot, "export_power") == 800.0
+
+    def test_live_state_cache_answers_without_a_request(self, ctrl):
+        ctrl.state_cache = MagicMock()
+        ctrl.state_cache.states.return_value = {"sensor.battery_soc": "64"}
+        ctrl.session.post = _session_method_mock("post")
+        ctrl.session.get = _session_method_mock("get")
+
+        snapshot = ctrl.snapshot(["battery_soc"])
+
+        assert snapshot.value("battery_soc") == 64.0
+        ctrl.session.post.assert_not_called()
+        ctrl.session.get.assert_not_called()
+
+    def test_entity_missing_from_the_cache_is_read_over_rest(self, ctrl):
+        ctrl.state_cache = MagicMock()
+        ctrl.state_cache.get.return_value = None
+        ctrl.state_cache.states.return_value = {"sensor.battery_soc": "64"}
+        ctrl.session.get = _session_method_mock(
+            "get",
+            return_value=_mock_response(
+                {"entity_id": "sensor.charge_power", "state": "300"}
+            ),
+        )
+
+        snapshot = ctrl.snapshot(["battery_soc", "battery_charge_power"])
+
+        assert snapshot.value("battery_charge_power") == 300.0
+        ctrl.session.get.assert_called_once()
@@ -0,0 +1,186 @@
+"""Tests for the WebSocket-fed HA state cache and the controller's use of it.
+
+The handshake and event handling are driven through ``HAStateCache._handle``
+with a recording ``send``, so no WebSocket is opened.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.bess.ha_api_controller import HomeAssistantAPIController
+from core.bess.ha_state_cache import HAStateCache, websocket_url
+from core.bess.settings_store import SettingsStore
+
+
+def _state(entity_id: str, state: str) -> dict:
+    return {"entity_id": entity_id, "state": state, "attributes": {}}
+
+
+def _event(entity_id: str, new_state: dict | None) -> dict:
+    return {
+        "id": 1,
+        "type": "event",
+        "event": {
+            "event_type": "state_changed",
+            "data": {"entity_id": entity_id, "new_state": new_state},
+        },
+    }
+
+
+def _no_reply(text):
+    raise AssertionError(f"unexpected send: {text}")
+
+
+def _subscribe(cache: HAStateCache, states: list[dict]) -> list[dict]:
+    """Run the handshake to a live subscription; return what the cache sent."""
+    sent: list[dict] = []
+
+    def send(text):
+        sent.append(json.loads(text))
+
+    cache._handle({"type": "auth_required"}, send)
+    cache._handle({"type": "auth_ok"}, send)
+    cache._handle({"id": 1, "type": "result", "success": True}, send)
+    cache._handle({"id": 2, "type": "result", "success": True, "result": states}, send)
+    return sent
+
+
+@pytest.fixture
+def cache():
+    return HAStateCache(
+        "ws://ha.local:8123/api/websocket",
+        "test-token",
+        tracked_entities=lambda: ["sensor.battery_soc"],
+    )
+
+
+def test_websocket_url_swaps_the_scheme():
+    assert websocket_url("https://ha.local/") == "wss://ha.local/api/websocket"
+    assert websocket_url("http://supervisor/core") == (
+        "ws://supervisor/core/api/websocket"
+    )
+
+
+def test_handshake_subscribes_before_taking_the_snapshot(cache):
+    sent = _subscribe(cache, [])
+
+    assert [m["type"] for m in sent] == ["auth", "subscribe_events", "get_states"]
+    assert sent[0]["access_token"] == "test-token"
+    assert sent[1]["event_type"] == "state_changed"
+
+
+def test_snapshot_seeds_only_tracked_entities(cache):
+    _subscribe(
+        cache,
+        [_state("sensor.battery_soc", "50"), _state("sensor.unrelated", "1")],
+    )
+
+    assert cache.live
+    assert cache.get("sensor.battery_soc") == _state("sensor.battery_soc", "50")
+    assert cache.get("sensor.unrelated") is None
+
+
+def test_events_update_cached_entities_and_ignore_others(cache):
+    _subscribe(cache, [_state("sensor.battery_soc", "50")])
+
+    cache._handle(
+        _event("sensor.battery_soc", _state("sensor.battery_soc", "51")), _no_reply
+    )
+    cache._handle(
+        _event("sensor.unrelated", _state("sensor.unrelated", "2")), _no_reply
+    )
+
+    assert cache.get("sensor.battery_soc")["state"] == "51"
+    assert cache.get("sensor.unrelated") is None
+
+
+def test_removed_entity_is_dropped(cache):
+    _subscribe(cache, [_state("sensor.battery_soc", "50")])
+
+    cache._handle(_event("sensor.battery_soc", None), _no_reply)
+
+    assert cache.get("sensor.battery_soc") is None
+
+
+def test_failed_subscription_never_serves_the_snapshot(cache):
+    cache._handle({"id": 1, "type": "result", "success": False}, _no_reply)
+    cache._handle(
+        {
+            "id": 2,
+            "type": "result",
+            "success": True,
+            "result": [_state("sensor.battery_soc", "50")],
+        },
+        _no_reply,
+    )
+
+    assert not cache.live
+    assert cache.get("sensor.battery_soc") is None
+
+
+def test_disconnect_clears_the_cache(cache):
+    _subscribe(cache, [_state("sensor.battery_soc", "50")])
+
+    cache._go_stale()
+
+    assert not cache.live
+    assert cache.get("sensor.battery_soc") is None
+    assert cache.age("sensor.battery_soc") is None
+
+
+def test_offer_never_overwrites_a_newer_event(cache):
+    _subscribe(cache, [])
+    cache.offer(_state("sensor.new", "1"))
+    cache._handle(_event("sensor.new", _state("sensor.new", "2")), _no_reply)
+    cache.offer(_state("sensor.new", "1"))
+
+    assert cache.get("sensor.new")["state"] == "2"
+
+
+@pytest.fixture
+def ctrl(cache):
+    store = SettingsStore()
+    store.data["sensors"] = {"battery_soc": "sensor.battery_soc"}
+    c = HomeAssistantAPIController(
+        ha_url="http://ha.local:8123", token="test-token", settings_store=store
+    )
+    c.max_attempts = 1
+    c.state_cache = cache
+    return c
+
+
+def _rest_state(ctrl, state: dict) -> MagicMock:
+    response = MagicMock(status_code=200, content=b"{}", text="{}")
+    response.headers = {"content-type": "application/json"}
+    response.json.return_value = state
+    get = MagicMock(return_value=response)
+    get.__name__ = "get"
+    ctrl.session.get = get
+    return get
+
+
+def test_live_cache_serves_reads_without_a_round_trip(ctrl, cache):
+    _subscribe(cache, [_state("sensor.battery_soc", "64")])
+    get = _rest_state(ctrl, _state("sensor.battery_soc", "0"))
+
+    assert ctrl.get_battery_soc() == 64.0
+    get.assert_not_called()
+
+
+def test_reads_fall_back_to_rest_until_subscribed(ctrl):
+    get = _rest_state(ctrl, _state("sensor.battery_soc", "12"))
+
+    assert ctrl.get_battery_soc() == 12.0
+    get.assert_called_once()
+
+
+def test_rest_fallback_adopts_an_uncached_entity(ctrl, cache):
+    _subscribe(cache, [])
+    get = _rest_state(ctrl, _state("sensor.battery_soc", "30"))
+
+    ctrl.get_battery_soc()
+    ctrl.get_battery_soc()
+
+    get.assert_called_once()
@@ -0,0 +1,25 @@
+"""The shared pooled HTTP sessions: one keep-alive session per host."""
+
+from core.bess import http_client
+
+
+def test_urls_on_one_host_share_a_session():
+    a = http_client.session_for("http://influx.local:8086/api/v2/query")
+    b = http_client.session_for("http://influx.local:8086/query?db=x")
+
+    assert a is b
+
+
+def test_each_host_gets_its_own_session():
+    influx = http_client.session_for("http://influx.local:8086/api/v2/query")
+    ha = http_client.session_for("http://supervisor/core/api/services")
+
+    assert influx is not ha
+
+
+def test_pool_blocks_at_the_per_host_connection_limit():
+    session = http_client.session_for("https://api.example.test/v1")
+    adapter = session.get_adapter("https://api.example.test/v1/rates")
+
+    assert adapter._pool_maxsize == http_client.MAX_CONNECTIONS_PER_HOST
+    assert adapter._pool_block is True
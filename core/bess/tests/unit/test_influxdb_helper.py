@@ -50,7 +50,7 @@ class TestGetSensorDataBatchSkipsUnconfigured:
                 "get_influxdb_config",
                 return_value=PLACEHOLDER_CONFIG,
             ),
-            patch.object(influxdb_helper.requests, "post") as mock_post,
+            patch.object(influxdb_helper.http_client, "post") as mock_post,
         ):
             result = influxdb_helper.get_sensor_data_batch(
                 ["sensor.battery_soc"], date(2026, 7, 1)
@@ -68,7 +68,7 @@ class TestGetPowerSensorDataBatchSkipsUnconfigured:
                 "get_influxdb_config",
                 return_value=PLACEHOLDER_CONFIG,
             ),
-            patch.object(influxdb_helper.requests, "post") as mock_post,
+            patch.object(influxdb_helper.http_client, "post") as mock_post,
         ):
             result = influxdb_helper.get_power_sensor_data_batch(
                 ["sensor.solar_power"], date(2026, 7, 1)
@@ -103,7 +103,7 @@ class TestErrorBodyIsSurfaced:
                 influxdb_helper, "get_influxdb_config", return_value=VALID_CONFIG
             ),
             patch.object(
-                influxdb_helper.requests,
+                influxdb_helper.http_client,
                 "post",
                 return_value=_mock_response(500, NO_DATABASE_BODY),
             ),
@@ -122,7 +122,7 @@ class TestErrorBodyIsSurfaced:
                 influxdb_helper, "get_influxdb_config", return_value=VALID_CONFIG
             ),
             patch.object(
-                influxdb_helper.requests,
+                influxdb_helper.http_client,
                 "post",
                 return_value=_mock_response(500, NO_DATABASE_BODY),
             ),
@@ -143,7 +143,7 @@ class TestErrorBodyIsSurfaced:
                 influxdb_helper, "get_influxdb_config", return_value=VALID_CONFIG
             ),
             patch.object(
-                influxdb_helper.requests,
+                influxdb_helper.http_client,
                 "post",
                 return_value=_mock_response(500, NO_DATABASE_BODY),
             ),
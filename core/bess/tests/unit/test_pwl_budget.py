@@ -0,0 +1,126 @@
+"""The budgeted PWL window resolver: windows are solved by value at stake
+until the deadline, the rest are reported as skipped, and leftover time
+widens the tie band. Without a budget nothing about a solve changes."""
+
+import time
+
+import pytest
+
+from core.bess.dp_battery_algorithm import optimize_battery_schedule
+from core.bess.pwl_budget import PWLWindowQueue, window_stake
+from core.bess.solve_timings import WINDOW_RESOLVED, WINDOW_SKIPPED
+from core.bess.tests.unit.test_scenarios import build_scenario_optimizer_inputs
+from core.bess.tie_detection import TIE_NOISE_FACTOR, Window
+
+STEP = 0.025
+CLEAR = 1.0
+
+
+def _drain(queue):
+    popped = []
+    while (queued := queue.pop()) is not None:
+        window, _ = queued
+        queue.mark_resolved(window)
+        popped.append(window)
+    return popped
+
+
+def test_stake_is_the_snap_noise_the_margins_leave_uncovered():
+    margins = [0.0, 0.01, CLEAR, float("inf")]
+    slopes = [1.0, 1.0, 1.0, 1.0]
+
+    stake = window_stake(Window(0, 4), margins, slopes, STEP)
+
+    assert stake == pytest.approx(0.025 + 0.015)
+
+
+def test_without_a_budget_windows_are_solved_in_detection_order():
+    windows = [Window(0, 3), Window(10, 13)]
+    margins = [CLEAR] * 13
+    margins[11] = 0.0  # the later window has more at stake
+
+    queue = PWLWindowQueue(windows, margins, [1.0] * 13, STEP)
+
+    assert _drain(queue) == windows
+    assert queue.skipped == []
+
+
+def test_under_a_budget_the_window_with_more_at_stake_goes_first():
+    windows = [Window(0, 3), Window(10, 13)]
+    margins = [CLEAR] * 13
+    margins[1] = 0.02
+    margins[11] = 0.0
+
+    queue = PWLWindowQueue(
+        windows, margins, [1.0] * 13, STEP, deadline=time.perf_counter() + 60
+    )
+
+    assert _drain(queue)[:2] == [Window(10, 13), Window(0, 3)]
+
+
+def test_windows_not_started_by_the_deadline_are_reported_skipped():
+    windows = [Window(0, 3), Window(10, 13)]
+
+    queue = PWLWindowQueue(
+        windows, [0.0] * 13, [1.0] * 13, STEP, deadline=time.perf_counter()
+    )
+
+    assert queue.pop() is None
+    assert [w for w, _ in queue.skipped] == windows
+    assert {factor for _, factor in queue.skipped} == {TIE_NOISE_FACTOR}
+
+
+def test_leftover_time_widens_the_band_but_never_next_to_a_resolved_window():
+    # Period 2 ties at 0.1x the snap noise; periods 6 and 20 only at 0.5x.
+    # Period 6's padded window would touch the resolved one, so only
+    # period 20's is added.
+    margins = [CLEAR] * 30
+    margins[2] = 0.0
+    margins[6] = 0.3 * STEP
+    margins[20] = 0.3 * STEP
+
+    queue = PWLWindowQueue(
+        [Window(0, 5)], margins, [1.0] * 30, STEP, deadline=time.perf_counter() + 60
+    )
+    first, _ = queue.pop()
+    queue.mark_resolved(first)
+    escalated = queue.pop()
+
+    assert escalated == (Window(18, 23), 0.5)
+
+
+def _scenario(**overrides):
+    _, kwargs = build_scenario_optimizer_inputs("synthetic_consumption_high_no_solar")
+    # The fixture's tie window (14, 19) exists at a zero terminal value; see
+    # test_issue_450_hybrid_resolution.
+    kwargs["terminal_value_per_kwh"] = 0.0
+    return {**kwargs, **overrides}
+
+
+@pytest.mark.slow
+def test_an_exhausted_budget_keeps_the_grid_schedule_and_says_so():
+    diagnostics: dict = {}
+    budgeted = optimize_battery_schedule(
+        **_scenario(pwl_budget_seconds=0.0, tie_diagnostics=diagnostics)
+    )
+    unbudgeted = optimize_battery_schedule(**_scenario())
+
+    assert diagnostics["skipped_windows"] == [Window(14, 19)]
+    assert budgeted.timings is not None
+    assert [(w.start, w.end, w.outcome) for w in budgeted.timings.pwl_windows] == [
+        (14, 19, WINDOW_SKIPPED)
+    ]
+    # Skipping is what costs the 0.06 SEK #450 resolution recovers here.
+    assert budgeted.reward_objective_cost > unbudgeted.reward_objective_cost
+
+
+@pytest.mark.slow
+def test_an_ample_budget_solves_everything_an_unbudgeted_solve_does():
+    budgeted = optimize_battery_schedule(**_scenario(pwl_budget_seconds=600.0))
+    unbudgeted = optimize_battery_schedule(**_scenario())
+
+    assert budgeted.timings is not None
+    solved = [w for w in budgeted.timings.pwl_windows if w.outcome == WINDOW_RESOLVED]
+    assert (solved[0].start, solved[0].end) == (14, 19)
+    assert all(w.outcome != WINDOW_SKIPPED for w in budgeted.timings.pwl_windows)
+    assert budgeted.reward_objective_cost <= unbudgeted.reward_objective_cost + 1e-9
@@ -0,0 +1,103 @@
+"""`optimize_battery_schedule(solver="pwl")`: the exact PWL DP over the whole
+horizon, ending in the grid DP's terminal value instead of a pinned SOE."""
+
+import numpy as np
+import pytest
+
+from core.bess.dp_battery_algorithm import (
+    SOLVER_PWL,
+    _discretize_state_action_space,
+    _run_dynamic_programming,
+    optimize_battery_schedule,
+)
+from core.bess.pwl_window_dp import _pwl_eval_array, _terminal_value_row
+from core.bess.settings import BatterySettings
+from core.bess.solve_timings import (
+    PHASE_BACKWARD_INDUCTION,
+    PHASE_FORWARD_SELECTION,
+    PHASE_REPLAY_ACCOUNTING,
+)
+from core.bess.tests.helpers import _scenario_inputs, realized_cost
+from core.bess.tests.unit.test_scenarios import build_scenario_optimizer_inputs
+
+
+def _battery() -> BatterySettings:
+    return BatterySettings(
+        total_capacity=10.0,
+        min_soc=10.0,
+        max_soc=100.0,
+        max_charge_power_kw=5.0,
+        max_discharge_power_kw=5.0,
+        efficiency_charge=0.95,
+        efficiency_discharge=0.95,
+        cycle_cost_per_kwh=0.0,
+        inverter_max_ac_power_kw=0.0,
+    )
+
+
+def test_terminal_row_matches_the_grid_dps_terminal_value():
+    battery = _battery()
+    soe_levels, _ = _discretize_state_action_space(battery)
+    V = _run_dynamic_programming(
+        horizon=1,
+        buy_price=[1.0],
+        sell_price=[0.5],
+        home_consumption=[0.5],
+        solar_production=[0.0],
+        initial_soe=battery.min_soe_kwh,
+        battery_settings=battery,
+        dt=0.25,
+        terminal_value_per_kwh=0.8,
+    )
+
+    row = _terminal_value_row(0.8, battery)
+
+    np.testing.assert_allclose(_pwl_eval_array(row, soe_levels), V[1], atol=1e-9)
+
+
+def test_unknown_solver_is_rejected():
+    with pytest.raises(ValueError, match="Unknown solver"):
+        optimize_battery_schedule(
+            buy_price=[1.0],
+            sell_price=[0.5],
+            home_consumption=[0.5],
+            battery_settings=_battery(),
+            solver="milp",
+        )
+
+
+@pytest.mark.slow
+def test_pwl_plan_is_executable_as_planned():
+    scenario, kwargs = build_scenario_optimizer_inputs(
+        "historical_2025_01_05_no_spread_no_solar"
+    )
+
+    result = optimize_battery_schedule(**kwargs, solver=SOLVER_PWL)
+
+    assert realized_cost(_scenario_inputs(scenario), result) == pytest.approx(
+        result.economic_summary.battery_solar_cost, abs=0.01
+    )
+    assert result.timings is not None
+    assert set(result.timings.phases) >= {
+        PHASE_BACKWARD_INDUCTION,
+        PHASE_FORWARD_SELECTION,
+        PHASE_REPLAY_ACCOUNTING,
+    }
+    assert result.timings.pwl_windows == []
+
+
+@pytest.mark.slow
+def test_pwl_is_never_worse_than_the_grid_dp_on_its_own_objective():
+    # At a zero terminal value the end SOE is free and worthless to both
+    # solvers, so the objective is the whole comparison. This fixture's tie
+    # window (14, 19) is where the grid DP's snap noise costs it.
+    _, kwargs = build_scenario_optimizer_inputs("synthetic_consumption_high_no_solar")
+    kwargs["terminal_value_per_kwh"] = 0.0
+
+    exact = optimize_battery_schedule(**kwargs, solver=SOLVER_PWL)
+    grid = optimize_battery_schedule(**kwargs)
+
+    assert exact.reward_objective_cost <= grid.reward_objective_cost + 1e-6
+    assert exact.economic_summary.battery_solar_cost == pytest.approx(
+        exact.reward_objective_cost, abs=1e-9
+    )
@@ -9,6 +9,7 @@ from core.bess.execution_model import DEFAULT_CAPABILITIES
 from core.bess.pwl_window_dp import (
     _backward_discharge_levels,
     _end_soe_pin_tolerance,
+    _merge_breakpoints,
     _pinned_terminal_row,
     _pwl_best_action_at_continuous_state,
     _pwl_candidate_values_at,
@@ -49,6 +50,18 @@ def test_pwl_eval_array_interpolates_between_breakpoints():
     assert result[1] == pytest.approx(12.5)
 
 
+def test_merge_breakpoints_keeps_known_values_and_the_left_of_a_near_duplicate():
+    xs, vs = _merge_breakpoints(
+        np.array([0.0, 2.0, 4.0]),
+        np.array([10.0, 12.0, 14.0]),
+        np.array([3.0, 2.0 + 1e-13, 1.0]),
+        np.array([13.5, -1.0, 11.5]),
+    )
+
+    np.testing.assert_array_equal(xs, [0.0, 1.0, 2.0, 3.0, 4.0])
+    np.testing.assert_array_equal(vs, [10.0, 11.5, 12.0, 13.5, 14.0])
+
+
 def test_pwl_eval_array_extrapolates_below_first_breakpoint():
     xs = np.array([1.0, 2.0])
     vs = np.array([10.0, 20.0])
@@ -697,3 +710,44 @@ def test_backward_pass_admits_the_discharge_levels_the_replay_admits():
         f"backward pass priced this state at {backward_value} SEK while the "
         f"replay achieves {replay_value} SEK from the same continuation row"
     )
+
+
+def test_refined_rows_hold_exactly_the_values_a_fresh_evaluation_gives():
+    """Refinement carries each kept breakpoint's value forward instead of
+    re-evaluating the whole row every round. That is only sound because a
+    state's Bellman value does not depend on which other states are
+    evaluated alongside it -- so a row re-evaluated from scratch at its own
+    breakpoints must reproduce the table bit for bit."""
+    battery = _tiny_battery()
+    dt = 0.25
+    inputs = (
+        [1.2, 0.4, 2.1, 0.9],
+        [0.6, 0.1, 1.5, 0.4],
+        [0.8, 0.5, 1.1, 0.7],
+        [0.0, 0.9, 0.3, 0.0],
+    )
+    buy, sell, home, solar = inputs
+    V = run_pwl_window_backward_induction(
+        window_horizon=4,
+        buy_price=buy,
+        sell_price=sell,
+        home_consumption=home,
+        solar_production=solar,
+        battery_settings=battery,
+        dt=dt,
+        end_soe_target=5.0,
+    )
+    power_row = np.concatenate(
+        (
+            [0.0],
+            _backward_discharge_levels(battery, DEFAULT_CAPABILITIES) * -1,
+            [POWER_STEP_KW],
+        )
+    )
+
+    for t in range(4):
+        xs, vs = V[t]
+        fresh = _pwl_candidate_values_at(
+            xs, t, V[t + 1], power_row, inputs, battery, dt, None
+        )
+        np.testing.assert_array_equal(vs, fresh)
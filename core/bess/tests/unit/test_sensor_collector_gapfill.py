@@ -10,9 +10,10 @@ InfluxDB-free correction via PowerSampleBuffer - see
 test_sensor_collector_runtime_gapfill.py (#387).
 """
 
-from datetime import date
+from datetime import date, datetime
 from unittest.mock import MagicMock, patch
 
+from core.bess.ha_api_controller import SensorSnapshot
 from core.bess.sensor_collector import SensorCollector
 from core.bess.settings import BatterySettings
 
@@ -87,12 +88,20 @@ class TestHistoricalBackfillGapFill:
     def test_runtime_collection_does_not_call_influxdb(self):
         """Runtime collection must never depend on InfluxDB (#387 constraint)."""
         ha = _make_ha_controller()
-        ha.get_battery_charged_lifetime.return_value = 100.0
-        ha.get_battery_discharged_lifetime.return_value = 50.0
-        ha.get_solar_production_lifetime.return_value = 200.0
-        ha.get_grid_import_lifetime.return_value = 300.0
-        ha.get_grid_export_lifetime.return_value = 10.0
-        ha.get_battery_soc.return_value = 45.0
+        entity_map = _entity_map()
+        live_values = {
+            "lifetime_battery_charged": 100.0,
+            "lifetime_battery_discharged": 50.0,
+            "lifetime_solar_energy": 200.0,
+            "lifetime_import_from_grid": 300.0,
+            "lifetime_export_to_grid": 10.0,
+            "battery_soc": 45.0,
+        }
+        ha.snapshot.return_value = SensorSnapshot(
+            taken_at=datetime(2026, 7, 25, 2, 45),
+            entity_ids={key: entity_map[key] for key in live_values},
+            states={entity_map[key]: str(v) for key, v in live_values.items()},
+        )
 
         battery_settings = BatterySettings(total_capacity=30.0)
         collector = SensorCollector(ha, battery_settings)
@@ -132,7 +141,8 @@ class TestSharedSignedPowerEntitiesExcluded:
     flow the map iterates last: charging energy would be recorded as
     battery_discharged. Such entities must be excluded from the InfluxDB
     power path entirely; the live PowerSampleBuffer path (#387) still covers
-    them because it reads through the sign-splitting getters.
+    them because it splits each live reading by sign
+    (HomeAssistantAPIController.power_from_snapshot).
     """
 
     @staticmethod
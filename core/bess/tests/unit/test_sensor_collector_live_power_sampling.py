@@ -4,15 +4,20 @@ Called every minute by a new scheduler job (Task 5) to record live power
 readings into the rolling buffer that collect_energy_data's runtime branch
 (Task 4) later consumes for gap-fill.
 
-Reads the 6 power sensors via their individual live-reading getters on
-ha_controller (get_pv_power, get_local_load_power, etc.) rather than the
-full-instance `_fetch_all_states()` dump - that method returns every entity
-in the user's HA instance and is too heavy to call once a minute (#387 final
-review).
+Reads the 6 power sensors with one ha_controller.snapshot() call, so all six
+are sampled at the same instant, and takes each directional reading through
+ha_controller.power_from_snapshot (which splits a shared signed entity). It
+never uses the full-instance `_fetch_all_states()` dump - that method returns
+every entity in the user's HA instance and is too heavy to call once a minute
+(#387 final review).
 """
 
+from datetime import datetime
 from unittest.mock import MagicMock
 
+import requests
+
+from core.bess.ha_api_controller import SensorSnapshot
 from core.bess.sensor_collector import SensorCollector
 from core.bess.settings import BatterySettings
 
@@ -34,10 +39,27 @@ def _entity_map():
     }
 
 
-def _make_collector():
+_POWER_STATES = {
+    "pv_power": "1000.0",
+    "local_load_power": "1500.0",
+    "import_power": "0.0",
+    "export_power": "0.0",
+    "battery_charge_power": "0.0",
+    "battery_discharge_power": "500.0",
+}
+
+
+def _make_collector(states=None):
     entity_map = _entity_map()
+    states = _POWER_STATES if states is None else states
     ha = MagicMock()
     ha.resolve_sensor_for_influxdb.side_effect = lambda key: entity_map.get(key)
+    ha.snapshot.side_effect = lambda keys: SensorSnapshot(
+        taken_at=datetime(2026, 7, 25, 2, 45),
+        entity_ids={key: entity_map[key] for key in keys},
+        states={entity_map[key]: state for key, state in states.items()},
+    )
+    ha.power_from_snapshot.side_effect = lambda snapshot, key: snapshot.value(key)
     battery_settings = BatterySettings(total_capacity=30.0)
     return SensorCollector(ha, battery_settings)
 
@@ -45,12 +67,6 @@ def _make_collector():
 class TestSampleLivePower:
     def test_records_all_configured_power_sensors_into_the_buffer(self):
         collector = _make_collector()
-        collector.ha_controller.get_pv_power.return_value = 1000.0
-        collector.ha_controller.get_local_load_power.return_value = 1500.0
-        collector.ha_controller.get_import_power.return_value = 0.0
-        collector.ha_controller.get_export_power.return_value = 0.0
-        collector.ha_controller.get_battery_charge_power.return_value = 0.0
-        collector.ha_controller.get_battery_discharge_power.return_value = 500.0
 
         collector.sample_live_power()
         result = collector._power_sample_buffer.consume(_current_period())
@@ -58,14 +74,17 @@ class TestSampleLivePower:
         assert result["solar_production"] == 0.25  # 1000W -> 0.25 kWh
         assert result["battery_discharged"] == 0.125  # 500W -> 0.125 kWh
 
-    def test_skips_a_sensor_whose_getter_raises_without_raising(self):
+    def test_reads_every_power_sensor_in_one_snapshot(self):
         collector = _make_collector()
-        collector.ha_controller.get_pv_power.side_effect = RuntimeError("unavailable")
-        collector.ha_controller.get_local_load_power.return_value = 1500.0
-        collector.ha_controller.get_import_power.return_value = 0.0
-        collector.ha_controller.get_export_power.return_value = 0.0
-        collector.ha_controller.get_battery_charge_power.return_value = 0.0
-        collector.ha_controller.get_battery_discharge_power.return_value = 500.0
+
+        collector.sample_live_power()
+
+        collector.ha_controller.snapshot.assert_called_once()
+        (keys,) = collector.ha_controller.snapshot.call_args.args
+        assert set(keys) == set(_POWER_STATES)
+
+    def test_skips_an_unavailable_sensor_without_raising(self):
+        collector = _make_collector({**_POWER_STATES, "pv_power": "unavailable"})
 
         collector.sample_live_power()  # must not raise
         result = collector._power_sample_buffer.consume(_current_period())
@@ -73,14 +92,8 @@ class TestSampleLivePower:
         assert "solar_production" not in result
         assert result["battery_discharged"] == 0.125
 
-    def test_skips_a_sensor_whose_getter_returns_non_numeric_value(self):
-        collector = _make_collector()
-        collector.ha_controller.get_pv_power.return_value = "unavailable"
-        collector.ha_controller.get_local_load_power.return_value = 1500.0
-        collector.ha_controller.get_import_power.return_value = 0.0
-        collector.ha_controller.get_export_power.return_value = 0.0
-        collector.ha_controller.get_battery_charge_power.return_value = 0.0
-        collector.ha_controller.get_battery_discharge_power.return_value = 500.0
+    def test_skips_a_sensor_with_a_non_numeric_state(self):
+        collector = _make_collector({**_POWER_STATES, "pv_power": "not_a_number"})
 
         collector.sample_live_power()  # must not raise
         result = collector._power_sample_buffer.consume(_current_period())
@@ -88,6 +101,22 @@ class TestSampleLivePower:
         assert "solar_production" not in result
         assert result["battery_discharged"] == 0.125
 
+    def test_skips_a_sensor_whose_split_raises(self):
+        collector = _make_collector()
+
+        def split(snapshot, key):
+            if key == "battery_charge_power":
+                raise ValueError("Unknown battery_power_polarity 'typo'")
+            return snapshot.value(key)
+
+        collector.ha_controller.power_from_snapshot.side_effect = split
+
+        collector.sample_live_power()  # must not raise
+        result = collector._power_sample_buffer.consume(_current_period())
+
+        assert "battery_charged" not in result
+        assert result["battery_discharged"] == 0.125
+
     def test_noop_when_no_power_sensors_configured(self):
         ha = MagicMock()
         ha.resolve_sensor_for_influxdb.return_value = None
@@ -95,20 +124,11 @@ class TestSampleLivePower:
 
         collector.sample_live_power()
 
-        ha.get_pv_power.assert_not_called()
+        ha.snapshot.assert_not_called()
 
-    def test_noop_when_all_getters_fail(self):
+    def test_noop_when_the_snapshot_fails(self):
         collector = _make_collector()
-        collector.ha_controller.get_pv_power.side_effect = RuntimeError("boom")
-        collector.ha_controller.get_local_load_power.side_effect = RuntimeError("boom")
-        collector.ha_controller.get_import_power.side_effect = RuntimeError("boom")
-        collector.ha_controller.get_export_power.side_effect = RuntimeError("boom")
-        collector.ha_controller.get_battery_charge_power.side_effect = RuntimeError(
-            "boom"
-        )
-        collector.ha_controller.get_battery_discharge_power.side_effect = RuntimeError(
-            "boom"
-        )
+        collector.ha_controller.snapshot.side_effect = requests.ConnectionError("boom")
 
         collector.sample_live_power()  # must not raise
 
@@ -9,9 +9,10 @@ a DEBUG comparison when the counter already had a real nonzero delta.
 """
 
 import logging
-from datetime import date
+from datetime import date, datetime
 from unittest.mock import MagicMock, patch
 
+from core.bess.ha_api_controller import SensorSnapshot
 from core.bess.sensor_collector import SensorCollector
 from core.bess.settings import BatterySettings
 
@@ -33,17 +34,32 @@ def _entity_map():
     }
 
 
+_LIVE_VALUES = {
+    "lifetime_battery_charged": 100.0,
+    "lifetime_battery_discharged": 50.0,
+    "lifetime_solar_energy": 200.0,
+    "lifetime_import_from_grid": 300.0,
+    "lifetime_export_to_grid": 10.0,
+    "battery_soc": 45.0,
+}
+
+
+def _serve_live_values(ha, values):
+    """Answer ha.snapshot() with the given sensor_key -> value readings."""
+    entity_map = _entity_map()
+    ha.snapshot.side_effect = lambda keys: SensorSnapshot(
+        taken_at=datetime(2026, 7, 25, 2, 45),
+        entity_ids={key: entity_map[key] for key in keys},
+        states={entity_map[key]: str(value) for key, value in values.items()},
+    )
+
+
 def _make_runtime_collector():
     entity_map = _entity_map()
     ha = MagicMock()
     ha.resolve_sensor_for_influxdb.side_effect = lambda key: entity_map.get(key)
     ha._resolve_entity_id.return_value = ("soc_entity", None)
-    ha.get_battery_charged_lifetime.return_value = 100.0
-    ha.get_battery_discharged_lifetime.return_value = 50.0
-    ha.get_solar_production_lifetime.return_value = 200.0
-    ha.get_grid_import_lifetime.return_value = 300.0
-    ha.get_grid_export_lifetime.return_value = 10.0
-    ha.get_battery_soc.return_value = 45.0
+    _serve_live_values(ha, _LIVE_VALUES)
 
     battery_settings = BatterySettings(total_capacity=30.0)
     collector = SensorCollector(ha, battery_settings)
@@ -113,7 +129,10 @@ class TestRuntimeGapFillFromBuffer:
     ):
         collector = _make_runtime_collector()
         # Give the current live reading a real nonzero discharge delta.
-        collector.ha_controller.get_battery_discharged_lifetime.return_value = 55.0
+        _serve_live_values(
+            collector.ha_controller,
+            {**_LIVE_VALUES, "lifetime_battery_discharged": 55.0},
+        )
         collector._power_sample_buffer.record(10, {"battery_discharged": 1000.0})
 
         with (
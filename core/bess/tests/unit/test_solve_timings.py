@@ -0,0 +1,131 @@
+"""Per-phase solve timings: what a solve records, and how a day of them is
+summarized for /api/performance."""
+
+import json
+import time
+
+import pytest
+
+from core.bess import tie_detection
+from core.bess.solve_timings import (
+    PHASE_BACKWARD_INDUCTION,
+    PHASE_FORWARD_SELECTION,
+    PHASE_PWL_RESOLUTION,
+    PHASE_REPLAY_ACCOUNTING,
+    PHASE_TIE_DETECTION,
+    PHASE_TIE_POLICY,
+    TOP_LEVEL_PHASES,
+    WINDOW_RESOLVED,
+    WINDOW_SKIPPED,
+    PWLWindowTiming,
+    SolveTimings,
+    record_phase,
+    recording,
+    summarize_solve_timings,
+)
+from core.bess.tests.helpers import run_scenario
+from core.bess.tests.unit.golden_capture import DATA_DIR
+from core.bess.tie_detection import Window
+
+
+def _fixture(name):
+    return json.loads((DATA_DIR / f"{name}.json").read_text())
+
+
+def test_recording_outside_a_solve_is_a_no_op():
+    record_phase(PHASE_TIE_POLICY, time.perf_counter())
+
+
+def test_recording_targets_only_the_enclosing_solve():
+    outer, inner = SolveTimings(), SolveTimings()
+    with recording(outer):
+        with recording(inner):
+            record_phase(PHASE_TIE_POLICY, time.perf_counter())
+        record_phase(PHASE_TIE_DETECTION, time.perf_counter())
+
+    assert set(inner.phases) == {PHASE_TIE_POLICY}
+    assert set(outer.phases) == {PHASE_TIE_DETECTION}
+
+
+def test_nested_tie_policy_never_dominates():
+    timings = SolveTimings(
+        phases={PHASE_FORWARD_SELECTION: 2.0, PHASE_TIE_POLICY: 1.9}, total=2.5
+    )
+
+    assert timings.dominant_phase() == PHASE_FORWARD_SELECTION
+
+
+def test_summary_counts_a_skipped_phase_as_zero():
+    solves = [
+        SolveTimings(phases={PHASE_BACKWARD_INDUCTION: 1.0}, total=1.2),
+        SolveTimings(
+            phases={PHASE_BACKWARD_INDUCTION: 1.0, PHASE_PWL_RESOLUTION: 30.0},
+            total=31.5,
+        ),
+    ]
+
+    summary = summarize_solve_timings(solves)
+
+    assert summary["solves"] == 2
+    assert summary["phases"][PHASE_PWL_RESOLUTION]["p50"] == 15.0
+    assert summary["phases"][PHASE_PWL_RESOLUTION]["max"] == 30.0
+    assert summary["slowest"] == {
+        "total": 31.5,
+        "dominant_phase": PHASE_PWL_RESOLUTION,
+    }
+    assert summary["pwl_windows"] == {"count": 0, "skipped": 0}
+
+
+def test_summary_counts_skipped_windows_apart_from_solved_ones():
+    solve = SolveTimings(
+        pwl_windows=[
+            PWLWindowTiming(0, 5, 2.0),
+            PWLWindowTiming(10, 15, 0.0, WINDOW_SKIPPED),
+        ],
+        total=3.0,
+    )
+
+    summary = summarize_solve_timings([solve])
+
+    assert summary["pwl_windows"]["count"] == 1
+    assert summary["pwl_windows"]["skipped"] == 1
+    assert summary["pwl_windows"]["p50"] == 2.0
+
+
+def test_summary_of_no_solves():
+    assert summarize_solve_timings([]) == {"solves": 0}
+
+
+@pytest.mark.slow
+def test_solve_records_every_phase_it_runs():
+    result = run_scenario(_fixture("historical_2025_01_05_no_spread_no_solar"))
+
+    timings = result.timings
+    assert timings is not None
+    assert set(timings.phases) == {
+        PHASE_BACKWARD_INDUCTION,
+        PHASE_FORWARD_SELECTION,
+        PHASE_TIE_DETECTION,
+        PHASE_TIE_POLICY,
+    }
+    assert timings.pwl_windows == []
+    assert sum(timings.phases.get(p, 0.0) for p in TOP_LEVEL_PHASES) <= timings.total
+
+
+@pytest.mark.slow
+def test_pwl_windows_are_itemised(monkeypatch):
+    monkeypatch.setattr(
+        tie_detection,
+        "detect_tie_windows",
+        lambda tie_margins, value_slopes, soe_step_kwh, pad=2: [Window(3, 5)],
+    )
+
+    result = run_scenario(_fixture("historical_2025_01_05_no_spread_no_solar"))
+
+    timings = result.timings
+    assert timings is not None
+    assert [(w.start, w.end, w.outcome) for w in timings.pwl_windows] == [
+        (3, 5, WINDOW_RESOLVED)
+    ]
+    assert timings.phases[PHASE_PWL_RESOLUTION] == timings.pwl_windows[0].seconds
+    assert PHASE_REPLAY_ACCOUNTING in timings.phases
@@ -20,23 +20,38 @@ Two things are pinned here, matching the two ways the passes can diverge:
    selector can pick but V has never heard of does not -- that is exactly
    how a plan ends up ranked by a value function that does not know the
    plan exists.
+
+A third pin covers the backward pass against itself: the banded evaluation
+production runs, and the optional fused JIT kernel, must reproduce the dense
+grid's V exactly -- the first only skips cells the dense grid masks to -inf,
+the second only reorders the same per-cell arithmetic.
 """
 
+import json
+
 import numpy as np
 import pytest
 
+from core.bess import dp_battery_algorithm
 from core.bess.action_selector import _residual_cover_p
 from core.bess.dp_battery_algorithm import (
+    GRID_EVALUATION_BANDED,
+    GRID_EVALUATION_DENSE,
+    GRID_EVALUATION_JIT,
+    DPWorkspace,
     _compute_reward,
     _compute_reward_grid,
     _effective_ac_cap_kwh,
+    _effective_import_cap_kwh,
     _run_dynamic_programming,
     _state_transition,
     _state_transition_grid,
 )
 from core.bess.dp_constants import SOE_STEP_KWH
+from core.bess.dp_jit_kernel import JIT_AVAILABLE
 from core.bess.execution_model import DEFAULT_CAPABILITIES
-from core.bess.tests.helpers import make_battery_settings
+from core.bess.tests.helpers import _scenario_inputs, make_battery_settings
+from core.bess.tests.unit.golden_capture import DATA_DIR, fixture_names
 
 DT = 0.25
 
@@ -44,19 +59,22 @@ DT = 0.25
 @pytest.mark.parametrize("solar", [0.0, 0.4, 2.5])
 @pytest.mark.parametrize("home", [0.05, 0.5])
 @pytest.mark.parametrize("import_cap_kwh", [None, 0.6])
+@pytest.mark.parametrize("use_workspace", [False, True])
 def test_vectorized_evaluator_matches_the_selectors_scalar_physics(
-    solar, home, import_cap_kwh
+    solar, home, import_cap_kwh, use_workspace
 ):
     """Both passes must compute the same next_soe, reward and grid import for
     the same action -- exactly, not approximately.
 
     The scalar functions are what `select_action` prices candidates with;
     the `_grid` twins are what the backward pass estimates V with. Any gap
-    means the DP optimizes one plan and the replay executes another.
+    means the DP optimizes one plan and the replay executes another. The
+    in-place `DPWorkspace` path the backward pass runs is pinned too.
     """
     settings = make_battery_settings(inverter_max_ac_power_kw=5.0)
     soes = np.arange(settings.min_soe_kwh, settings.max_soe_kwh, 1.3)
     powers = np.array([-10.0, -3.0, -0.2, 0.0, 0.1, 4.0, 10.0])
+    workspace = DPWorkspace(soes.size * powers.size) if use_workspace else None
 
     grid_next_soe = _state_transition_grid(
         soes.reshape(-1, 1),
@@ -67,6 +85,7 @@ def test_vectorized_evaluator_matches_the_selectors_scalar_physics(
         home_consumption=home,
         ac_cap_kwh=_effective_ac_cap_kwh(settings, DT),
         import_cap_kwh=import_cap_kwh,
+        workspace=workspace,
     )
     grid_reward, grid_imported = _compute_reward_grid(
         powers.reshape(1, -1),
@@ -79,6 +98,7 @@ def test_vectorized_evaluator_matches_the_selectors_scalar_physics(
         current_sell_price=0.4,
         solar_production=solar,
         import_cap_kwh=import_cap_kwh,
+        workspace=workspace,
     )
 
     for i, soe in enumerate(soes):
@@ -252,3 +272,82 @@ def test_backward_pass_values_the_solar_export_bypass_candidate():
         _single_period_value(settings, home, solar, buy, sell, soe, soe)
         == bypass_reward
     )
+
+
+def _dense_and(grid_evaluation, **kwargs):
+    return (
+        _run_dynamic_programming(grid_evaluation=GRID_EVALUATION_DENSE, **kwargs),
+        _run_dynamic_programming(grid_evaluation=grid_evaluation, **kwargs),
+    )
+
+
+def _per_period_bounds_inputs(horizon):
+    buy = [0.5 + ((t * 5) % 7) * 0.3 for t in range(horizon)]
+    return {
+        "horizon": horizon,
+        "buy_price": buy,
+        "sell_price": [p - 0.6 for p in buy],
+        "home_consumption": [0.2 + 0.9 * (t % 3) for t in range(horizon)],
+        "solar_production": [
+            max(0.0, 1.6 - abs(t - horizon / 2) * 0.15) for t in range(horizon)
+        ],
+        "battery_settings": make_battery_settings(inverter_max_ac_power_kw=6.0),
+        "dt": DT,
+        "terminal_value_per_kwh": 0.7,
+        "max_charge_power_per_period": [10.0 - (t % 4) * 2.5 for t in range(horizon)],
+        "import_cap_kwh": 0.9,
+    }
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    "grid_evaluation", [GRID_EVALUATION_BANDED, GRID_EVALUATION_JIT]
+)
+@pytest.mark.parametrize("name", fixture_names())
+def test_grid_evaluation_matches_dense_on_every_fixture(name, grid_evaluation):
+    if grid_evaluation == GRID_EVALUATION_JIT and not JIT_AVAILABLE:
+        pytest.skip("numba not installed; JIT falls back to banded")
+    inputs = _scenario_inputs(json.loads((DATA_DIR / f"{name}.json").read_text()))
+    dt = inputs["period_duration_hours"]
+
+    dense, evaluated = _dense_and(
+        grid_evaluation,
+        horizon=len(inputs["buy_price"]),
+        buy_price=inputs["buy_price"],
+        sell_price=inputs["sell_price"],
+        home_consumption=inputs["home_consumption"],
+        solar_production=inputs["solar_production"],
+        battery_settings=inputs["battery_settings"],
+        dt=dt,
+        terminal_value_per_kwh=inputs.get("terminal_value_per_kwh", 0.0),
+        import_cap_kwh=_effective_import_cap_kwh(inputs.get("home_settings"), dt),
+    )
+
+    assert np.array_equal(dense, evaluated)
+
+
+def test_banded_evaluation_matches_dense_under_every_per_period_bound():
+    """The bounds the corpus rarely combines: temperature derating (moves the
+    charge limit per period), the AC-output cap (moves the discharge band per
+    period with solar) and the import cap (whose floor is a min over the
+    feasible actions, so a band that dropped a feasible column would move
+    it)."""
+    dense, banded = _dense_and(
+        GRID_EVALUATION_BANDED, **_per_period_bounds_inputs(horizon=24)
+    )
+
+    assert np.array_equal(dense, banded)
+
+
+def test_fused_kernel_matches_dense_under_every_per_period_bound(monkeypatch):
+    """Same bounds through the fused kernel. Without numba the kernel runs
+    as plain Python (forced on here rather than falling back to banded), so
+    its arithmetic is pinned on every host; the horizon is kept short for
+    that case."""
+    monkeypatch.setattr(dp_battery_algorithm, "JIT_AVAILABLE", True)
+
+    dense, fused = _dense_and(
+        GRID_EVALUATION_JIT, **_per_period_bounds_inputs(horizon=3)
+    )
+
+    assert np.array_equal(dense, fused)
@@ -39,8 +39,8 @@ def _make_ha_forecast_response(temps: list[float], start_hour: int = 0):
 
 @pytest.fixture
 def mock_post():
-    """Patch requests.post for all weather tests."""
-    with patch("core.bess.weather.requests.post") as mock:
+    """Patch the pooled HTTP post for all weather tests."""
+    with patch("core.bess.weather.http_client.post") as mock:
         yield mock
 
 
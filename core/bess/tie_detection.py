@@ -58,7 +58,11 @@ class Window:
     end: int
 
 
-def epsilon_for_period(value_slope: float, soe_step_kwh: float) -> float:
+def epsilon_for_period(
+    value_slope: float,
+    soe_step_kwh: float,
+    noise_factor: float = TIE_NOISE_FACTOR,
+) -> float:
     """Value noise (currency) that SOE_STEP_KWH grid-snapping can inject
     into a single period's action comparison, given the local marginal
     value of stored energy `value_slope` (dV/dSoE, currency per kWh).
@@ -66,8 +70,11 @@ def epsilon_for_period(value_slope: float, soe_step_kwh: float) -> float:
     Public because the #450 coverage-measurement harness must compare a
     period's margin against this exact threshold -- a harness that
     re-derived the formula could drift from the detector it is measuring.
+    `noise_factor` is overridden only by the budgeted resolver
+    (`pwl_budget`), which widens the detection band when it has time left;
+    the tie policy always uses the default.
     """
-    return TIE_NOISE_FACTOR * soe_step_kwh * abs(value_slope)
+    return noise_factor * soe_step_kwh * abs(value_slope)
 
 
 def detect_tie_windows(
@@ -75,6 +82,7 @@ def detect_tie_windows(
     value_slopes: list[float],
     soe_step_kwh: float,
     pad: int = 2,
+    noise_factor: float = TIE_NOISE_FACTOR,
 ) -> list[Window]:
     horizon = len(tie_margins)
     if len(value_slopes) != horizon:
@@ -82,7 +90,7 @@ def detect_tie_windows(
             f"value_slopes has {len(value_slopes)} entries but tie_margins has "
             f"{horizon} -- they must be recorded per period in the same pass"
         )
-    epsilons = [epsilon_for_period(s, soe_step_kwh) for s in value_slopes]
+    epsilons = [epsilon_for_period(s, soe_step_kwh, noise_factor) for s in value_slopes]
     flagged = [t for t in range(horizon) if tie_margins[t] < epsilons[t]]
 
     # Two structural blind spots, logged rather than left invisible because
@@ -8,7 +8,7 @@ import logging
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
-import requests
+from . import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -53,7 +53,7 @@ def fetch_hourly_weather_forecast(
     }
 
     logger.info("Fetching weather forecast from HA (%s)...", weather_entity)
-    response = requests.post(url, headers=headers, json=payload, timeout=30)
+    response = http_client.post(url, headers=headers, json=payload, timeout=30)
 
     if response.status_code != 200:
         raise RuntimeError(
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Benchmark the optimizer over the whole fixture corpus and gate on a baseline.
+
+Solves every fixture in `core/bess/tests/unit/data/` over a process pool and
+records, per fixture, solve latency (p50/p95 over `--repeats`), peak traced
+memory, the number of #450 PWL re-solves and the realized cost -- see
+`core/bess/tests/unit/benchmark_capture.py` for what each figure means and
+how it is measured.
+
+The corpus latency quoted in `dp_constants.py` (15.2s -> 11.2s) was measured
+by hand, once. This makes that measurement repeatable and keeps the result:
+
+    # compare against the committed baseline; exit 1 on a regression
+    .venv/bin/python scripts/bench_fixture_corpus.py
+
+    # (re)write the baseline after a deliberate change
+    .venv/bin/python scripts/bench_fixture_corpus.py --record
+
+A realized-cost rise gates everywhere. A latency rise gates only when the
+baseline was recorded in the same environment (interpreter, numpy, machine,
+pool size, repeats); on any other machine it is printed and ignored, so
+record a local baseline first with `--record --baseline <path>` when the
+latency gate is what you are after.
+
+Usage:
+    .venv/bin/python scripts/bench_fixture_corpus.py --only regression_
+    .venv/bin/python scripts/bench_fixture_corpus.py --workers 4 --repeats 7
+    .venv/bin/python scripts/bench_fixture_corpus.py --json /tmp/run.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+repo_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(repo_root))
+
+from core.bess.tests.unit.benchmark_capture import (  # noqa: E402
+    BASELINE_PATH,
+    compare,
+    environment,
+    measure_corpus,
+)
+from core.bess.tests.unit.golden_capture import fixture_names  # noqa: E402
+
+
+def _print_table(fixtures: dict[str, dict]) -> None:
+    header = (
+        f"{'fixture':<56} {'H':>4} {'p50 s':>8} {'p95 s':>8} "
+        f"{'peak MB':>8} {'pwl':>4} {'realized SEK':>13}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, m in fixtures.items():
+        if m["status"] != "ok":
+            print(f"{name:<56} ERROR {m['error']}")
+            continue
+        print(
+            f"{name:<56} {m['periods']:>4} {m['latency_p50_s']:>8.3f} "
+            f"{m['latency_p95_s']:>8.3f} {m['peak_memory_mb']:>8.1f} "
+            f"{m['pwl_resolves']:>4} {m['realized_cost']:>13.4f}"
+        )
+    ok = [m for m in fixtures.values() if m["status"] == "ok"]
+    print()
+    print(
+        f"{len(ok)}/{len(fixtures)} solved | corpus p50 "
+        f"{sum(m['latency_p50_s'] for m in ok):.2f}s | "
+        f"{sum(1 for m in ok if m['pwl_resolves'])} with PWL re-solves"
+    )
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--only", default="", help="substring filter on fixture name")
+    ap.add_argument("--repeats", type=int, default=5, help="timed solves per fixture")
+    ap.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="process pool size"
+    )
+    ap.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    ap.add_argument(
+        "--record", action="store_true", help="write the baseline instead of gating"
+    )
+    ap.add_argument(
+        "--latency-tolerance",
+        type=float,
+        default=0.25,
+        help="relative p50 rise that counts as a regression",
+    )
+    ap.add_argument(
+        "--latency-floor",
+        type=float,
+        default=0.05,
+        help="absolute p50 rise in seconds below which latency never regresses",
+    )
+    ap.add_argument(
+        "--cost-tolerance",
+        type=float,
+        default=1e-6,
+        help="realized-cost rise in currency units that counts as a regression",
+    )
+    ap.add_argument("--json", default="", help="also write this run to this path")
+    args = ap.parse_args()
+
+    names = [name for name in fixture_names() if args.only in name]
+    if not names:
+        print(f"No fixtures matching {args.only!r}", file=sys.stderr)
+        return 1
+
+    print(
+        f"{len(names)} fixtures | {args.workers} workers | {args.repeats} repeats",
+        flush=True,
+    )
+    t0 = time.perf_counter()
+    run = {
+        "environment": environment(args.workers, args.repeats),
+        "fixtures": measure_corpus(names, args.repeats, args.workers),
+    }
+    print(f"measured in {time.perf_counter() - t0:.1f}s wall clock\n")
+    _print_table(run["fixtures"])
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(run, indent=1) + "\n")
+        print(f"\nwrote {args.json}")
+
+    if args.record:
+        if args.only:
+            # A filtered run would silently drop every other fixture from the
+            # baseline, leaving them ungated from then on.
+            print("refusing to --record a filtered run", file=sys.stderr)
+            return 1
+        args.baseline.write_text(json.dumps(run, indent=1) + "\n")
+        print(f"\nrecorded baseline {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"\nno baseline at {args.baseline}; run with --record", file=sys.stderr)
+        return 1
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(
+        baseline,
+        run,
+        latency_tolerance=args.latency_tolerance,
+        latency_floor_s=args.latency_floor,
+        cost_tolerance=args.cost_tolerance,
+    )
+    if baseline["environment"] != run["environment"]:
+        print(
+            "\nbaseline was recorded in a different environment; "
+            "latency is reported, not gated:"
+        )
+        print(f"  baseline: {baseline['environment']}")
+        print(f"  this run: {run['environment']}")
+
+    gating = [r for r in regressions if r.gating]
+    print()
+    for regression in regressions:
+        print(f"{'REGRESSION' if regression.gating else 'drift     '} {regression}")
+    if gating:
+        print(f"\n{len(gating)} regression(s) against {args.baseline}")
+        return 1
+    print(f"no regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
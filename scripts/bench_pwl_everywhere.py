@@ -10,22 +10,18 @@ This measures the three modes on every fixture in the canonical corpus:
 
   grid    -- grid DP only, tie detection forced to return no windows
   hybrid  -- exactly what ships today
-  pwl     -- tie detection forced to return one window spanning the horizon
-
-All three run through the *same* `optimize_battery_schedule` code path; the
-only difference is what `detect_tie_windows` returns. No solver logic is
-reimplemented here, so a mode's cost is directly comparable to the others.
-
-IMPORTANT CAVEAT ON `pwl` MODE
-------------------------------
-`run_pwl_window_backward_induction` has no terminal-value mode: its terminal
-row is always a hard SOE pin (`_pinned_terminal_row`, pwl_window_dp.py:748).
-So even a horizon-spanning window inherits the *grid DP's* terminal SOE. This
-benchmark therefore answers "can PWL decide every period affordably, holding
-terminal SOE fixed?" -- it does NOT show PWL replacing the grid DP outright.
-Retiring the grid DP entirely additionally requires giving the PWL solver a
-real terminal value row. Objective deltas here are clean (both modes end at
-the same SOE, so no terminal-value confound); latency is the decisive number.
+  pwl     -- `optimize_battery_schedule(solver="pwl")`: the exact PWL DP over
+             the whole horizon, no grid pass at all
+
+All three run through `optimize_battery_schedule`; grid and hybrid differ only
+in what `detect_tie_windows` returns. No solver logic is reimplemented here,
+so a mode's cost is directly comparable to the others.
+
+`pwl` mode ends in the same terminal value row as the grid DP
+(`pwl_window_dp._terminal_value_row`) rather than at the grid DP's terminal
+SOE, so it measures PWL replacing the grid DP outright. Its end SOE is its
+own: an objective delta includes whatever the two solvers leave in the
+battery, which the terminal value prices but the reported cost does not.
 
 Usage:
     .venv/bin/python scripts/bench_pwl_everywhere.py
@@ -46,8 +42,8 @@ repo_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(repo_root))
 
 from core.bess import tie_detection  # noqa: E402
+from core.bess.dp_battery_algorithm import SOLVER_PWL  # noqa: E402
 from core.bess.tests.helpers import _scenario_inputs  # noqa: E402
-from core.bess.tie_detection import Window  # noqa: E402
 
 DATA_DIR = repo_root / "core" / "bess" / "tests" / "unit" / "data"
 
@@ -80,14 +76,13 @@ def _run_mode(scenario: dict, mode: str, repeats: int, timeout_s: int) -> dict:
     def no_windows(tie_margins, value_slopes, soe_step_kwh, pad=2):
         return []
 
-    def whole_horizon(tie_margins, value_slopes, soe_step_kwh, pad=2):
-        return [Window(0, len(tie_margins))]
-
-    patch = {"grid": no_windows, "hybrid": real_detect, "pwl": whole_horizon}[mode]
+    patch = {"grid": no_windows, "hybrid": real_detect, "pwl": real_detect}[mode]
 
     inputs = _scenario_inputs(scenario)
     if mode == "hybrid":
         inputs["tie_diagnostics"] = diag
+    if mode == "pwl":
+        inputs["solver"] = SOLVER_PWL
 
     tie_detection.detect_tie_windows = patch
     try:
@@ -18,7 +18,7 @@ from pathlib import Path
 from typing import Any
 
 from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 logging.basicConfig(
     level=logging.INFO,
@@ -67,6 +67,8 @@ _hourly_consumption_kwh: dict[int, float] = {}
 # verbatim from the debug log's "## HA Statistics" section (exact real data,
 # preferred over _hourly_consumption_kwh's single-day approximation).
 _ha_statistics_raw: dict[str, list[dict]] = {}
+# Open WebSocket connections subscribed to state_changed → their subscription id
+_state_subscribers: dict[WebSocket, int] = {}
 
 
 def _hourly_consumption_from_periods(periods: list) -> dict[int, float]:
@@ -452,6 +454,27 @@ async def get_state(entity_id: str) -> JSONResponse:
     return JSONResponse(_make_state_response(entity_id, value))
 
 
+_STATES_TEMPLATE = re.compile(r"\{\{\s*states\('([^']+)'\)\s*\|\s*to_json\s*\}\}")
+
+
+@app.post("/api/template")
+async def render_template(request: Request) -> PlainTextResponse:
+    """Render the one template form BESS sends: {{ states('<id>') | to_json }}.
+
+    Everything else in the template is passed through verbatim — this is not
+    a Jinja engine.
+    """
+    body = await request.json()
+
+    def _state_json(match: re.Match) -> str:
+        value = _sensors.get(match.group(1))
+        if value is None:
+            return json.dumps("unknown")
+        return json.dumps(_make_state_response(match.group(1), value)["state"])
+
+    return PlainTextResponse(_STATES_TEMPLATE.sub(_state_json, body["template"]))
+
+
 # ---------------------------------------------------------------------------
 # Home Assistant service API
 # ---------------------------------------------------------------------------
@@ -539,6 +562,9 @@ async def call_service(domain: str, service: str, request: Request) -> JSONRespo
         else:
             _sensors[entity_id] = {"state": state, "attributes": {}}
 
+    if domain in ("select", "number", "input_number", "switch"):
+        await _broadcast_state_changed(body.get("entity_id", ""))
+
     # All write operations: record and acknowledge
     return JSONResponse({})
 
@@ -548,6 +574,24 @@ async def call_service(domain: str, service: str, request: Request) -> JSONRespo
 # ---------------------------------------------------------------------------
 
 
+async def _broadcast_state_changed(entity_id: str) -> None:
+    """Push a state_changed event for entity_id to every subscriber."""
+    if entity_id not in _sensors:
+        return
+    new_state = _make_state_response(entity_id, _sensors[entity_id])
+    for ws, sub_id in list(_state_subscribers.items()):
+        await ws.send_json(
+            {
+                "id": sub_id,
+                "type": "event",
+                "event": {
+                    "event_type": "state_changed",
+                    "data": {"entity_id": entity_id, "new_state": new_state},
+                },
+            }
+        )
+
+
 @app.websocket("/api/websocket")
 async def ha_websocket(ws: WebSocket) -> None:
     """Mock the HA WebSocket API used by BESS setup discovery.
@@ -558,6 +602,10 @@ async def ha_websocket(ws: WebSocket) -> None:
       - config/device_registry/list
       - get_services
       - config/entity_registry/list
+
+    plus get_states and subscribe_events(state_changed) for the controller's
+    state cache; sensor updates and state-mutating service calls are pushed
+    to subscribers.
     """
     await ws.accept()
     try:
@@ -582,7 +630,28 @@ async def ha_websocket(ws: WebSocket) -> None:
                 "config/entity_registry/list": _entity_registry,
             }
 
-            if cmd_type == "recorder/statistics_during_period":
+            if cmd_type == "get_states":
+                await ws.send_json(
+                    {
+                        "id": cmd_id,
+                        "type": "result",
+                        "success": True,
+                        "result": [
+                            _make_state_response(eid, val)
+                            for eid, val in _sensors.items()
+                        ],
+                    }
+                )
+            elif (
+                cmd_type == "subscribe_events"
+                and msg.get("event_type") == "state_changed"
+            ):
+                _state_subscribers[ws] = cmd_id
+                await ws.send_json(
+                    {"id": cmd_id, "type": "result", "success": True, "result": None}
+                )
+                logger.info("WS %-40s → subscribed", cmd_type)
+            elif cmd_type == "recorder/statistics_during_period":
                 statistic_ids = msg.get("statistic_ids", [])
                 start_time = msg.get("start_time")
                 end_time = msg.get("end_time")
@@ -653,6 +722,8 @@ async def ha_websocket(ws: WebSocket) -> None:
                 logger.warning("WS unknown command: %s", cmd_type)
     except WebSocketDisconnect:
         pass
+    finally:
+        _state_subscribers.pop(ws, None)
 
 
 # ---------------------------------------------------------------------------
@@ -678,6 +749,7 @@ async def update_sensor(entity_id: str, request: Request) -> dict:
     body = await request.json()
     _sensors[entity_id] = body
     logger.info("Sensor updated: %s = %s", entity_id, body)
+    await _broadcast_state_changed(entity_id)
     return {"status": "ok", "entity_id": entity_id}
 
 
@@ -694,6 +766,7 @@ async def root() -> dict:
         "name": "Mock Home Assistant API",
         "endpoints": {
             "sensors": "/api/states/{entity_id}",
+            "template": "POST /api/template",
             "services": "/api/services/{domain}/{service}",
             "service_log": "/mock/service_log",
             "sensor_list": "/mock/sensors",